@@ -0,0 +1,149 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Optional C accelerator for SubtitleManager._normalise_srt.
+
+Build in place with:
+
+    pip install cython
+    cythonize -i core/_srt_fast.pyx
+
+SubtitleManager falls back to the pure-Python normaliser when this module
+is not compiled, so the extension is never required — it only makes
+importing very large SRTs (10k+ cues) faster by walking the raw byte
+buffer instead of building per-line Python strings.
+"""
+
+
+cdef inline bint _is_digit(char c) nogil:
+    return c >= c'0' and c <= c'9'
+
+
+cdef long _parse_tc(const char* buf, Py_ssize_t n, Py_ssize_t* pos):
+    """
+    Parses H{1,2}:MM:SS[,.]m{1,3} at *pos, returns milliseconds or -1.
+    Advances *pos past the timecode on success.
+    """
+    cdef Py_ssize_t i = pos[0]
+    cdef long h = 0, m = 0, s = 0, ms = 0
+    cdef int digits = 0
+
+    while i < n and _is_digit(buf[i]) and digits < 2:
+        h = h * 10 + (buf[i] - c'0'); i += 1; digits += 1
+    if digits == 0 or i >= n or buf[i] != c':':
+        return -1
+    i += 1
+    if i + 1 >= n or not _is_digit(buf[i]) or not _is_digit(buf[i + 1]):
+        return -1
+    m = (buf[i] - c'0') * 10 + (buf[i + 1] - c'0'); i += 2
+    if i >= n or buf[i] != c':':
+        return -1
+    i += 1
+    if i + 1 >= n or not _is_digit(buf[i]) or not _is_digit(buf[i + 1]):
+        return -1
+    s = (buf[i] - c'0') * 10 + (buf[i + 1] - c'0'); i += 2
+    if i >= n or (buf[i] != c',' and buf[i] != c'.'):
+        return -1
+    i += 1
+    digits = 0
+    while i < n and _is_digit(buf[i]) and digits < 3:
+        ms = ms * 10 + (buf[i] - c'0'); i += 1; digits += 1
+    if digits == 0:
+        return -1
+    # Pad sub-millisecond fields: ",07" means 70 ms, not 7 ms
+    while digits < 3:
+        ms *= 10; digits += 1
+
+    pos[0] = i
+    return (h * 3600 + m * 60 + s) * 1000 + ms
+
+
+cdef bint _is_cue_header(const char* buf, Py_ssize_t n, Py_ssize_t start, Py_ssize_t end):
+    """True when buf[start:end] is a digits-only line followed by a timecode."""
+    cdef Py_ssize_t j = start
+    if j >= end:
+        return False
+    while j < end:
+        if not _is_digit(buf[j]):
+            return False
+        j += 1
+    j = end + 1                            # first byte of the next line
+    return j < n and _parse_tc(buf, n, &j) >= 0
+
+
+cdef void _emit_tc(long ms, bytearray out):
+    cdef long h = ms // 3600000
+    cdef long rem = ms % 3600000
+    cdef long m = rem // 60000
+    cdef long s = (rem % 60000) // 1000
+    cdef long ms_part = rem % 1000
+    out += b'%02d:%02d:%02d,%03d' % (h, m, s, ms_part)
+
+
+def normalize_srt(bytes data not None) -> bytes:
+    """
+    Byte-level equivalent of SubtitleManager._normalise_srt: renumbers
+    cues, rewrites timecodes canonically, and joins blocks with blank
+    lines. Input and output are UTF-8 bytes; CRLF and bare-CR line
+    endings are converted to LF, matching the Python fallback.
+    """
+    data = data.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+    cdef const char* buf = data
+    cdef Py_ssize_t n = len(data)
+    cdef Py_ssize_t i = 0, line_start, arrow, text_start, text_end
+    cdef long start_ms, end_ms, cue_index = 0
+    cdef bytearray out = bytearray()
+
+    while i < n:
+        line_start = i
+        # Find end of current line
+        while i < n and buf[i] != c'\n':
+            i += 1
+
+        # Try to parse "start --> end" on this line
+        arrow = line_start
+        start_ms = _parse_tc(buf, i, &arrow)
+        if start_ms < 0:
+            i += 1
+            continue
+        while arrow < i and (buf[arrow] == c' ' or buf[arrow] == c'\t'):
+            arrow += 1
+        if arrow + 2 >= i or buf[arrow] != c'-' or buf[arrow + 1] != c'-' or buf[arrow + 2] != c'>':
+            i += 1
+            continue
+        arrow += 3
+        while arrow < i and (buf[arrow] == c' ' or buf[arrow] == c'\t'):
+            arrow += 1
+        end_ms = _parse_tc(buf, i, &arrow)
+        if end_ms < 0:
+            i += 1
+            continue
+
+        # Collect the text block: lines until a blank line, the next cue
+        # header (digits-only line followed by a timecode), or EOF
+        i += 1
+        text_start = i
+        text_end = i
+        while i < n:
+            line_start = i
+            while i < n and buf[i] != c'\n':
+                i += 1
+            if i == line_start:            # blank line terminates the cue
+                break
+            if _is_cue_header(buf, n, line_start, i):
+                i = line_start             # leave it for the outer loop
+                break
+            text_end = i
+            i += 1
+
+        cue_index += 1
+        if cue_index > 1:
+            out += b'\n\n'
+        out += b'%d\n' % cue_index
+        _emit_tc(start_ms, out)
+        out += b' --> '
+        _emit_tc(end_ms, out)
+        out += b'\n'
+        out += data[text_start:text_end]
+
+    out += b'\n'
+    return bytes(out)
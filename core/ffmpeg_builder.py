@@ -1,18 +1,173 @@
+import functools
 import re
+import subprocess
+from types import MappingProxyType
 
 
 # ---------------------------------------------------------------------------
 # Quality presets
 # Software codecs (libx264/libx265) use CRF + preset.
-# HW codecs (videotoolbox) use average bitrate.
-# Format: (crf_x264, crf_x265, hw_mbps_video, audio_kbps)
+# HW codecs (videotoolbox) use average bitrate; NVENC uses constant quality.
+# Format: (crf_x264, crf_x265, hw_mbps_video, nvenc_cq, audio_kbps)
 # ---------------------------------------------------------------------------
 QUALITY_PRESETS = {
-    "Low":    (28, 32,  4,  128),
-    "Medium": (20, 24,  8,  192),
-    "Best":   (14, 16, 20,  320),
+    "Low":    (28, 32,  4, 28, 128),
+    "Medium": (20, 24,  8, 23, 192),
+    "Best":   (14, 16, 20, 19, 320),
 }
 
+# Hardware encoders in order of preference when codec == "auto".
+_HW_ENCODER_CANDIDATES = (
+    "h264_nvenc",
+    "h264_videotoolbox",
+)
+
+_SW_PRESETS = {"Low": "fast", "Medium": "medium", "Best": "slow"}
+
+
+def _codec_flags(codec, quality) -> tuple:
+    """Codec-specific quality flags; evaluated once per pair at import."""
+    crf_264, crf_265, hw_mbps, nvenc_cq, _audio_kbps = QUALITY_PRESETS[quality]
+    if codec == "libx264":
+        return ("-crf", str(crf_264), "-preset", _SW_PRESETS[quality])
+    if codec == "libx265":
+        return ("-crf", str(crf_265), "-preset", _SW_PRESETS[quality], "-tag:v", "hvc1")
+    if codec in ("h264_videotoolbox", "hevc_videotoolbox"):
+        flags = ("-b:v", f"{hw_mbps}M", "-realtime", "0")
+        if quality == "Best":
+            flags += ("-q:v", "60")
+        return flags
+    if codec in ("h264_nvenc", "hevc_nvenc"):
+        return ("-cq", str(nvenc_cq), "-preset", "p4", "-tune", "hq",
+                "-rc", "vbr", "-b:v", "0")
+    return ("-crf", str(crf_264))        # unknown codec fallback
+
+
+_KNOWN_CODECS = (
+    "libx264", "libx265",
+    "h264_videotoolbox", "hevc_videotoolbox",
+    "h264_nvenc", "hevc_nvenc",
+    None,                                # fallback row for unknown codecs
+)
+
+# Immutable (codec, quality) → flags table; _quality_flags is reduced to a
+# dict lookup plus the dynamic -threads / audio-bitrate suffix.
+_QUALITY_FLAG_TABLE = {
+    (codec, quality): _codec_flags(codec, quality)
+    for codec in _KNOWN_CODECS
+    for quality in QUALITY_PRESETS
+}
+
+_AUDIO_FLAGS = {
+    quality: ("-b:a", f"{preset[-1]}k")
+    for quality, preset in QUALITY_PRESETS.items()
+}
+
+# ---------------------------------------------------------------------------
+# Cached style helpers
+# Preview scrubbing re-parses the same UI style string dozens of times per
+# second, so both helpers are memoized on their (immutable) string inputs.
+# ---------------------------------------------------------------------------
+
+_STYLE_RE = re.compile(r'(\w+)=([^,]+)')
+
+_STYLE_DEFAULTS = MappingProxyType({
+    'FontName':      'Arial',
+    'FontSize':      50,
+    'MarginV':       60,
+    'Shadow':        2,
+    'Outline':       0,           # 0 = no outline by default
+    'PrimaryColour': '#FFFFFF',
+    'OutlineColour': '#000000',
+    'OutlineAlpha':  0,           # 0=opaque … 255=transparent (ASS)
+    'Bold':          '0',
+    'Italic':        '0',
+})
+
+_INT_STYLE_KEYS = frozenset({'FontSize', 'MarginV', 'Shadow', 'Outline', 'OutlineAlpha'})
+
+# Paths made of these characters need no filter-argument escaping;
+# SubtitleManager.create_safe_copy deliberately produces such paths.
+_SAFE_PATH_RE = re.compile(r'^[A-Za-z0-9_/.\-]+$')
+
+# The force_style layout never changes, only the values do; one template
+# + format_map beats re-assembling eleven f-string fragments per call.
+_FORCE_STYLE_TEMPLATE = (
+    "FontName={FontName},"
+    "FontSize={FontSize},"
+    "PrimaryColour={PrimaryColour},"
+    "OutlineColour={OutlineColour},"
+    "MarginV={MarginV},"
+    "BorderStyle={BorderStyle},"
+    "Outline={Outline},"
+    "Shadow={Shadow},"
+    "Bold={Bold},"
+    "Italic={Italic},"
+    "Alignment=2"
+)
+
+
+@functools.lru_cache(maxsize=512)
+def _hex_to_ass_color(hex_color: str, alpha: int = 0) -> str:
+    """
+    Convert #RRGGBB → ASS &H(AA)(BB)(GG)(RR).
+    alpha: 0 = fully opaque, 255 = fully transparent (ASS convention).
+    """
+    hex_color = hex_color.lstrip('#')
+    if len(hex_color) != 6:
+        hex_color = 'FFFFFF'
+    r, g, b = hex_color[0:2], hex_color[2:4], hex_color[4:6]
+    return f"&H{alpha:02X}{b}{g}{r}"
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_styles(s: str):
+    """Parse the comma-separated key=value style string from the UI."""
+    d = dict(_STYLE_DEFAULTS)
+    for key, val in _STYLE_RE.findall(s):
+        if key in d:
+            val = val.strip()
+            d[key] = int(val) if key in _INT_STYLE_KEYS else val
+    return MappingProxyType(d)
+
+
+@functools.lru_cache(maxsize=128)
+def _build_subtitle_filter(safe_sub_path: str, sub_styles_str: str) -> str:
+    """
+    Returns the full  subtitles='path':force_style='...'  filter string,
+    memoized on its two string inputs: consecutive previews and batch jobs
+    reuse the assembled spec instead of re-deriving colours and escaping.
+
+    Outline handling:
+      - If Outline == 0 → no visible stroke (BorderStyle=1, Outline=0).
+      - If Outline  > 0 → outline with user-controlled opacity.
+    OutlineAlpha 0 = fully opaque, 255 = fully transparent (ASS).
+    """
+    s = _parse_styles(sub_styles_str)
+
+    ass_primary = _hex_to_ass_color(s['PrimaryColour'], alpha=0)
+    ass_outline = _hex_to_ass_color(
+        s['OutlineColour'],
+        alpha=min(255, max(0, s['OutlineAlpha']))
+    )
+
+    force_style = _FORCE_STYLE_TEMPLATE.format_map({
+        **s,
+        'PrimaryColour': ass_primary,
+        'OutlineColour': ass_outline,
+        'BorderStyle':   1,   # outline+shadow style (Outline=0 → invisible)
+    })
+
+    if _SAFE_PATH_RE.match(safe_sub_path):
+        safe_path = safe_sub_path        # fast path: nothing to escape
+    else:
+        safe_path = (safe_sub_path
+                     .replace('\\', '\\\\')
+                     .replace(':', '\\:')
+                     .replace("'", "\\'"))
+
+    return f"subtitles='{safe_path}':force_style='{force_style}'"
+
 
 class FFmpegBuilder:
     """
@@ -26,119 +181,80 @@ class FFmpegBuilder:
     """
 
     # ------------------------------------------------------------------ #
-    #  Colour helpers                                                      #
+    #  Hardware encoder detection                                          #
     # ------------------------------------------------------------------ #
 
-    @staticmethod
-    def _hex_to_ass_color(hex_color: str, alpha: int = 0) -> str:
+    _hw_encoder_cache: str | None = None
+    _hw_encoder_probed: bool = False
+
+    @classmethod
+    def _detect_hw_encoder(cls) -> str | None:
         """
-        Convert #RRGGBB → ASS &H(AA)(BB)(GG)(RR).
-        alpha: 0 = fully opaque, 255 = fully transparent (ASS convention).
+        Returns the best available hardware encoder name (h264_nvenc on
+        NVIDIA boxes, h264_videotoolbox on Apple Silicon) or None when only
+        software encoding is available. The `ffmpeg -encoders` probe runs
+        once per process and is memoized.
         """
-        hex_color = hex_color.lstrip('#')
-        if len(hex_color) != 6:
-            hex_color = 'FFFFFF'
-        r, g, b = hex_color[0:2], hex_color[2:4], hex_color[4:6]
-        return f"&H{alpha:02X}{b}{g}{r}"
+        if cls._hw_encoder_probed:
+            return cls._hw_encoder_cache
+        cls._hw_encoder_probed = True
+        try:
+            result = subprocess.run(
+                ["ffmpeg", "-hide_banner", "-encoders"],
+                capture_output=True, text=True, timeout=10,
+            )
+            available = result.stdout
+        except Exception:
+            available = ""
+        for enc in _HW_ENCODER_CANDIDATES:
+            if enc in available:
+                cls._hw_encoder_cache = enc
+                break
+        return cls._hw_encoder_cache
+
+    @classmethod
+    def resolve_codec(cls, video_codec: str) -> str:
+        """Map the 'auto' codec choice to a real encoder name."""
+        if video_codec != "auto":
+            return video_codec
+        return cls._detect_hw_encoder() or "libx264"
 
     # ------------------------------------------------------------------ #
-    #  Style string parser                                                 #
+    #  Colour helpers                                                      #
     # ------------------------------------------------------------------ #
 
-    @staticmethod
-    def _parse_styles(s: str) -> dict:
-        """Parse the comma-separated key=value style string from the UI."""
-        d: dict = {
-            'FontName':      'Arial',
-            'FontSize':      50,
-            'MarginV':       60,
-            'Shadow':        2,
-            'Outline':       0,           # 0 = no outline by default
-            'PrimaryColour': '#FFFFFF',
-            'OutlineColour': '#000000',
-            'OutlineAlpha':  0,           # 0=opaque … 255=transparent (ASS)
-            'Bold':          '0',
-            'Italic':        '0',
-        }
-        int_keys = {'FontSize', 'MarginV', 'Shadow', 'Outline', 'OutlineAlpha'}
-        for key in d:
-            m = re.search(rf'{re.escape(key)}=([^,]+)', s)
-            if m:
-                val = m.group(1).strip()
-                d[key] = int(val) if key in int_keys else val
-        return d
+    # Cached module-level implementations (shared across previews/jobs)
+    _hex_to_ass_color = staticmethod(_hex_to_ass_color)
 
     # ------------------------------------------------------------------ #
-    #  Filter builder                                                      #
+    #  Style string parser                                                 #
     # ------------------------------------------------------------------ #
 
-    @staticmethod
-    def build_subtitle_filter(safe_sub_path: str, sub_styles_str: str) -> str:
-        """
-        Returns the full  subtitles='path':force_style='...'  filter string.
+    _parse_styles = staticmethod(_parse_styles)
 
-        Outline handling:
-          - If Outline == 0 → no visible stroke (BorderStyle=1, Outline=0).
-          - If Outline  > 0 → outline with user-controlled opacity.
-        OutlineAlpha 0 = fully opaque, 255 = fully transparent (ASS).
-        """
-        s = FFmpegBuilder._parse_styles(sub_styles_str)
-
-        ass_primary = FFmpegBuilder._hex_to_ass_color(s['PrimaryColour'], alpha=0)
-        ass_outline = FFmpegBuilder._hex_to_ass_color(
-            s['OutlineColour'],
-            alpha=min(255, max(0, s['OutlineAlpha']))
-        )
-
-        outline_val  = s['Outline']   # 0 = no stroke
-        border_style = 1              # outline+shadow style (Outline=0 → invisible)
-
-        force_style = (
-            f"FontName={s['FontName']},"
-            f"FontSize={s['FontSize']},"
-            f"PrimaryColour={ass_primary},"
-            f"OutlineColour={ass_outline},"
-            f"MarginV={s['MarginV']},"
-            f"BorderStyle={border_style},"
-            f"Outline={outline_val},"
-            f"Shadow={s['Shadow']},"
-            f"Bold={s['Bold']},"
-            f"Italic={s['Italic']},"
-            f"Alignment=2"
-        )
-
-        safe_path = (safe_sub_path
-                     .replace('\\', '\\\\')
-                     .replace(':', '\\:')
-                     .replace("'", "\\'"))
+    # ------------------------------------------------------------------ #
+    #  Filter builder                                                      #
+    # ------------------------------------------------------------------ #
 
-        return f"subtitles='{safe_path}':force_style='{force_style}'"
+    build_subtitle_filter = staticmethod(_build_subtitle_filter)
 
     # ------------------------------------------------------------------ #
     #  Quality helpers                                                     #
     # ------------------------------------------------------------------ #
 
     @staticmethod
-    def _quality_flags(codec: str, quality: str) -> list:
-        crf_264, crf_265, hw_mbps, audio_kbps = QUALITY_PRESETS.get(
-            quality, QUALITY_PRESETS["Medium"]
-        )
-        flags: list = []
-
-        if codec == "libx264":
-            preset = {"Low": "fast", "Medium": "medium", "Best": "slow"}[quality]
-            flags += ["-crf", str(crf_264), "-preset", preset]
-        elif codec == "libx265":
-            preset = {"Low": "fast", "Medium": "medium", "Best": "slow"}[quality]
-            flags += ["-crf", str(crf_265), "-preset", preset, "-tag:v", "hvc1"]
-        elif codec in ("h264_videotoolbox", "hevc_videotoolbox"):
-            flags += ["-b:v", f"{hw_mbps}M", "-realtime", "0"]
-            if quality == "Best":
-                flags += ["-q:v", "60"]
-        else:
-            flags += ["-crf", str(crf_264)]
-
-        flags += ["-b:a", f"{audio_kbps}k"]
+    def _quality_flags(codec: str, quality: str, threads: int = 0) -> list:
+        if quality not in QUALITY_PRESETS:
+            quality = "Medium"
+        key = (codec if (codec, quality) in _QUALITY_FLAG_TABLE else None, quality)
+        flags = list(_QUALITY_FLAG_TABLE[key])
+
+        # Cap encoder threads so concurrent software jobs share the CPU
+        # instead of each grabbing every core. HW encoders ignore this.
+        if threads > 0 and codec in ("libx264", "libx265"):
+            flags += ["-threads", str(threads)]
+
+        flags += _AUDIO_FLAGS[quality]
         return flags
 
     # ------------------------------------------------------------------ #
@@ -156,28 +272,37 @@ class FFmpegBuilder:
         duration_sec: float = 0.0,
         quality: str = "Medium",
         resolution: str = "1920x1080",
+        threads: int = 0,
     ) -> list:
+        # "auto" picks NVENC/VideoToolbox when the local FFmpeg exposes it.
+        # The background is lavfi-generated and subtitles are burnt on the
+        # CPU, so only the encode stage moves to hardware; the encoder
+        # uploads frames itself, no explicit hwupload is needed.
+        video_codec = FFmpegBuilder.resolve_codec(video_codec)
+
         bg_color = bg_hex.lstrip("#")
         w, h = (int(x) for x in resolution.split('x'))
         w += w % 2;  h += h % 2          # must be even
         res_str = f"{w}x{h}"
 
-        cmd = [
-            "ffmpeg", "-y",
-            "-f", "lavfi",
-            "-i", f"color=c=#{bg_color}:s={res_str}:r=25",
-            "-i", input_video,
-        ]
+        cmd = ["ffmpeg", "-y", "-i", input_video]
+
+        # The solid background is generated inside the filtergraph rather
+        # than as a second demuxed input: one input stream less to mux and
+        # no extra decode thread for the colour source.
+        bg_src = f"color=c=#{bg_color}:s={res_str}:r=25"
+        if duration_sec > 0:
+            bg_src += f":d={duration_sec}"
 
         if safe_sub_path:
             sf = FFmpegBuilder.build_subtitle_filter(safe_sub_path, sub_styles)
-            cmd += ["-filter_complex", f"[0:v]{sf}[v]",
-                    "-map", "[v]", "-map", "1:a?"]
+            cmd += ["-filter_complex", f"{bg_src}[bg];[bg]{sf}[v]"]
         else:
-            cmd += ["-map", "0:v", "-map", "1:a?"]
+            cmd += ["-filter_complex", f"{bg_src}[v]"]
+        cmd += ["-map", "[v]", "-map", "0:a?"]
 
         cmd += ["-c:v", video_codec, "-c:a", "aac"]
-        cmd += FFmpegBuilder._quality_flags(video_codec, quality)
+        cmd += FFmpegBuilder._quality_flags(video_codec, quality, threads)
         cmd += ["-progress", "pipe:1", "-nostats"]
 
         if duration_sec > 0:
@@ -186,6 +311,66 @@ class FFmpegBuilder:
         cmd.append(output_path)
         return cmd
 
+    # ------------------------------------------------------------------ #
+    #  Batch burn command                                                  #
+    # ------------------------------------------------------------------ #
+
+    @staticmethod
+    def build_batch_burn_command(
+        jobs: list,
+        bg_hex: str,
+        sub_styles: str,
+        video_codec: str = "libx264",
+        quality: str = "Medium",
+        resolution: str = "1920x1080",
+        threads: int = 0,
+    ) -> list:
+        """
+        Builds one FFmpeg command that renders several jobs sharing the same
+        style/codec/background in a single invocation, amortizing process
+        startup and libass font-scan cost across all of them.
+
+        Each entry in `jobs` is a dict with keys:
+            input, safe_sub (may be None), output, duration
+        """
+        video_codec = FFmpegBuilder.resolve_codec(video_codec)
+
+        bg_color = bg_hex.lstrip("#")
+        w, h = (int(x) for x in resolution.split('x'))
+        w += w % 2;  h += h % 2
+        res_str = f"{w}x{h}"
+
+        # Global options must precede the outputs; trailing options after the
+        # last output file are rejected by FFmpeg.
+        cmd = ["ffmpeg", "-y", "-progress", "pipe:1", "-nostats"]
+        for job in jobs:
+            cmd += ["-i", job["input"]]
+
+        # Backgrounds are generated inside the filtergraph (one per output)
+        # instead of as extra lavfi inputs; see build_burn_command.
+        filters = []
+        for idx, job in enumerate(jobs):
+            bg_src = f"color=c=#{bg_color}:s={res_str}:r=25"
+            if job.get("duration", 0) > 0:
+                bg_src += f":d={job['duration']}"
+            if job.get("safe_sub"):
+                sf = FFmpegBuilder.build_subtitle_filter(job["safe_sub"], sub_styles)
+                filters.append(f"{bg_src}[bg{idx}];[bg{idx}]{sf}[v{idx}]")
+            else:
+                filters.append(f"{bg_src}[v{idx}]")
+        cmd += ["-filter_complex", ";".join(filters)]
+
+        quality_flags = FFmpegBuilder._quality_flags(video_codec, quality, threads)
+        for idx, job in enumerate(jobs):
+            cmd += ["-map", f"[v{idx}]", "-map", f"{idx}:a?"]
+            cmd += ["-c:v", video_codec, "-c:a", "aac"]
+            cmd += quality_flags
+            if job.get("duration", 0) > 0:
+                cmd += ["-t", str(job["duration"])]
+            cmd.append(job["output"])
+
+        return cmd
+
     # ------------------------------------------------------------------ #
     #  Preview command                                                     #
     # ------------------------------------------------------------------ #
@@ -194,14 +379,34 @@ class FFmpegBuilder:
     def build_preview_command(
         input_video: str,
         safe_sub_path: str,
-        output_path: str,
         time_sec: float,
         sub_styles: str,
         bg_hex: str = "00FF00",
         resolution: str = "1920x1080",
+        preview_size: str = None,
     ) -> list:
+        """
+        Builds a single-frame preview command that writes the encoded frame
+        to stdout (`image2pipe`) so the caller never touches the filesystem.
+
+        `preview_size` ("WxH", in device pixels) caps the generated frame at
+        what the preview widget can actually display: the colour source is
+        produced at the displayed size (keeping the target aspect), so
+        libass rasterizes and mjpeg encodes a fraction of the full-
+        resolution pixels. ASS styling is PlayRes-relative, so the smaller
+        frame still looks like the final render.
+        """
         bg_color = bg_hex.lstrip("#")
         w, h = (int(x) for x in resolution.split('x'))
+        if preview_size:
+            pw, ph = (int(x) for x in preview_size.split('x'))
+            if 0 < pw < w and 0 < ph < h:
+                # Fit the target aspect ratio inside the displayed box.
+                if pw * h > ph * w:
+                    pw = max(2, ph * w // h)
+                else:
+                    ph = max(2, pw * h // w)
+                w, h = pw, ph
         w += w % 2;  h += h % 2
         res_str = f"{w}x{h}"
 
@@ -218,5 +423,75 @@ class FFmpegBuilder:
         else:
             cmd += ["-map", "0:v"]
 
-        cmd += ["-frames:v", "1", "-q:v", "1", "-f", "image2", output_path]
+        # PPM instead of MJPEG: writing raw pixels skips the DCT encode in
+        # FFmpeg and the JPEG decode in Qt — the format existed only to
+        # transport pixels over the pipe.
+        cmd += ["-frames:v", "1", "-f", "image2pipe", "-vcodec", "ppm", "pipe:1"]
+        return cmd
+
+    # Frame rate of the lavfi colour sources used throughout the builder;
+    # batch previews address frames on this grid.
+    PREVIEW_FPS = 25
+
+    @staticmethod
+    def quantize_preview_times(times: list) -> list:
+        """Snaps requested times (seconds) to the 25 fps lavfi grid and
+        returns the deduplicated, sorted frame numbers."""
+        fps = FFmpegBuilder.PREVIEW_FPS
+        return sorted({max(0, round(t * fps)) for t in times})
+
+    @staticmethod
+    def build_preview_batch_command(
+        input_video: str,
+        safe_sub_path: str,
+        frame_numbers: list,
+        sub_styles: str,
+        bg_hex: str = "00FF00",
+        resolution: str = "1920x1080",
+        preview_size: str = None,
+    ) -> list:
+        """
+        Like build_preview_command but emits several frames from one
+        invocation: a `select` expression picks the requested frame numbers
+        (from quantize_preview_times) out of a single burnt stream, so
+        process startup and the libass font scan are paid once for the
+        whole batch. Frames arrive concatenated on stdout as PPM.
+        """
+        bg_color = bg_hex.lstrip("#")
+        w, h = (int(x) for x in resolution.split('x'))
+        if preview_size:
+            pw, ph = (int(x) for x in preview_size.split('x'))
+            if 0 < pw < w and 0 < ph < h:
+                if pw * h > ph * w:
+                    pw = max(2, ph * w // h)
+                else:
+                    ph = max(2, pw * h // w)
+                w, h = pw, ph
+        w += w % 2;  h += h % 2
+        res_str = f"{w}x{h}"
+
+        fps = FFmpegBuilder.PREVIEW_FPS
+        # Seek to the window like the single-frame path does: without it
+        # every frame from t=0 up to the scrub position would run through
+        # libass just to be dropped by select, making prefetch cost grow
+        # with absolute position instead of window size. select counts
+        # frames from the seek point, so the indices are rebased onto it.
+        base = frame_numbers[0]
+        expr = '+'.join(f'eq(n\\,{n - base})' for n in frame_numbers)
+        sel = f"select='{expr}'"
+
+        cmd = [
+            "ffmpeg", "-y",
+            "-ss", str(base / fps),
+            "-f", "lavfi",
+            "-i", f"color=c=#{bg_color}:s={res_str}:r={fps}",
+        ]
+        if safe_sub_path:
+            sf = FFmpegBuilder.build_subtitle_filter(safe_sub_path, sub_styles)
+            cmd += ["-filter_complex", f"[0:v]{sf},{sel}[v]", "-map", "[v]"]
+        else:
+            cmd += ["-filter_complex", f"[0:v]{sel}[v]", "-map", "[v]"]
+
+        cmd += ["-vsync", "vfr", "-frames:v", str(len(frame_numbers)),
+                "-f", "image2pipe", "-vcodec", "ppm", "pipe:1"]
         return cmd
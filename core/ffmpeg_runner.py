@@ -1,7 +1,10 @@
+import os
+import select
+import socket
 import subprocess
-import threading
+import tempfile
 import time
-import re
+import uuid
 from typing import Callable, Optional
 
 
@@ -24,13 +27,14 @@ class FFmpegRunner:
       We now guard with a try/except and clamp to >= 0.
     - Removed the `self._process.communicate()` call after the stdout-read loop.
       `communicate()` tries to read stdout again which blocks forever because
-      the pipe is already at EOF.  We now read stderr via a background thread
-      while stdout is consumed in the main loop.
+      the pipe is already at EOF.  Progress and stderr are now both drained
+      from one select() loop, so no helper thread is spawned per invocation.
     """
 
     def __init__(self):
         self._process: Optional[subprocess.Popen] = None
         self._cancelled = False
+        self._wake_w: Optional[int] = None    # self-pipe: cancel() wakes select()
 
     def run_command(
         self,
@@ -45,7 +49,26 @@ class FFmpegRunner:
         self._cancelled = False
         start_time = time.time()
 
+        # Prefer a Unix socket for progress: FFmpeg writes the key=value
+        # reports there instead of stdout, decoupling progress from the
+        # stdio pipes and letting us poll at our own pace. Falls back to
+        # reading pipe:1 where AF_UNIX is unavailable or the command does
+        # not use -progress.
+        listener = None
+        sock_path = None
+        cancelled = False
+        wake_r, self._wake_w = os.pipe()
         try:
+            if hasattr(socket, "AF_UNIX") and "-progress" in cmd and "pipe:1" in cmd:
+                sock_path = os.path.join(
+                    tempfile.gettempdir(), f"ffprog_{uuid.uuid4().hex}.sock"
+                )
+                listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                listener.bind(sock_path)
+                listener.listen(1)
+                cmd = list(cmd)
+                cmd[cmd.index("-progress") + 1] = f"unix://{sock_path}"
+
             # Debug log
             try:
                 with open("/tmp/ffcmd.log", "w") as f:
@@ -53,49 +76,42 @@ class FFmpegRunner:
             except Exception:
                 pass
 
-            # Collect stderr in a background thread to avoid deadlocks
-            stderr_lines: list = []
+            stderr_chunks: list = []
 
+            # close_fds=False lets CPython launch via posix_spawn instead
+            # of fork+exec, skipping the fork's page-table copy. Safe here:
+            # the app opens no sensitive fds for FFmpeg to inherit.
             self._process = subprocess.Popen(
                 cmd,
-                stdout=subprocess.PIPE,
+                stdout=subprocess.DEVNULL if listener else subprocess.PIPE,
                 stderr=subprocess.PIPE,
-                universal_newlines=True,
-                bufsize=1,
+                bufsize=0,
+                close_fds=False,
             )
 
-            def _drain_stderr():
-                for line in self._process.stderr:
-                    stderr_lines.append(line)
+            # One select loop multiplexes progress and stderr — no
+            # per-invocation drain thread.
+            cancelled = not self._pump_process(
+                listener,
+                None if listener else self._process.stdout.fileno(),
+                wake_r, stderr_chunks, total_duration_sec, progress_callback,
+            )
+            if self._process.stdout is not None:
+                self._process.stdout.close()
 
-            stderr_thread = threading.Thread(target=_drain_stderr, daemon=True)
-            stderr_thread.start()
+            if cancelled:
+                return RenderResult(False, "", 0.0, "Job cancelled by user.")
 
-            # Read stdout (where -progress pipe:1 writes key=value pairs)
-            for line in self._process.stdout:
-                if self._cancelled:
-                    self._process.terminate()
-                    self._process.wait()
-                    return RenderResult(False, "", 0.0, "Job cancelled by user.")
-
-                if progress_callback and total_duration_sec > 0:
-                    if line.startswith("out_time_ms="):
-                        raw = line.split("=", 1)[1].strip()
-                        try:
-                            current_us = int(raw)
-                            if current_us >= 0:
-                                current_sec = current_us / 1_000_000.0
-                                pct = min((current_sec / total_duration_sec) * 100.0, 100.0)
-                                progress_callback(pct, "")
-                        except ValueError:
-                            pass
-
-            self._process.stdout.close()
             self._process.wait()
-            stderr_thread.join(timeout=5)
+            # Pick up any stderr emitted between the last select round and
+            # process exit (returns immediately at EOF).
+            tail = self._process.stderr.read()
+            if tail:
+                stderr_chunks.append(tail)
 
             if self._process.returncode != 0 and not self._cancelled:
-                err_text = "".join(stderr_lines[-40:])  # last 40 lines are enough
+                err_lines = b"".join(stderr_chunks).splitlines(keepends=True)
+                err_text = b"".join(err_lines[-40:]).decode(errors='replace')
                 return RenderResult(False, "", 0.0, f"FFmpeg Error (code {self._process.returncode}):\n{err_text}")
 
             elapsed_sec = time.time() - start_time
@@ -108,28 +124,146 @@ class FFmpegRunner:
             return RenderResult(False, "", 0.0, f"Runner exception: {str(e)}")
         finally:
             self._process = None
+            wake_w, self._wake_w = self._wake_w, None
+            for fd in (wake_r, wake_w):
+                try:
+                    os.close(fd)
+                except OSError:
+                    pass
+            if listener is not None:
+                try:
+                    listener.close()
+                    os.unlink(sock_path)
+                except OSError:
+                    pass
 
-    def capture_single_frame(self, cmd: list) -> bool:
+    def _pump_process(
+        self,
+        listener: Optional[socket.socket],
+        progress_fd: Optional[int],
+        wake_fd: int,
+        stderr_chunks: list,
+        total_duration_sec: float,
+        progress_callback: Optional[Callable[[float, str], None]],
+    ) -> bool:
         """
-        Executes an instantaneous command like frame extraction without progress piping.
+        Single select() loop that accepts the progress-socket connection
+        (when one is expected), reads key=value progress reports in raw
+        1 MiB chunks, and drains stderr — all without a helper thread.
+        cancel() writes to the wake pipe so the loop reacts immediately
+        instead of waiting out a poll interval.
+        Returns False if the job was cancelled.
         """
+        conn: Optional[socket.socket] = None
+        stderr_fd = self._process.stderr.fileno()
+        buf = bytearray()
         try:
-            result = subprocess.run(
+            while True:
+                if self._cancelled:
+                    self._process.terminate()
+                    self._process.wait()
+                    return False
+
+                rlist = [f for f in (listener, progress_fd, stderr_fd) if f is not None]
+                if not rlist:
+                    return True
+                ready, _, _ = select.select(rlist + [wake_fd], [], [], 1.0)
+                if not ready:
+                    if self._process.poll() is not None:
+                        return True
+                    continue
+
+                if wake_fd in ready:
+                    os.read(wake_fd, 1)
+                    continue    # re-check _cancelled at the top
+
+                if listener in ready:
+                    conn, _addr = listener.accept()
+                    progress_fd = conn.fileno()
+                    listener = None    # stop watching once connected
+                if stderr_fd in ready:
+                    chunk = os.read(stderr_fd, 1 << 20)
+                    if chunk:
+                        stderr_chunks.append(chunk)
+                    else:
+                        stderr_fd = None
+                if progress_fd in ready:
+                    chunk = os.read(progress_fd, 1 << 20)
+                    if not chunk:
+                        progress_fd = None
+                        continue
+                    buf += chunk
+                    nl = buf.rfind(b'\n')
+                    if nl == -1:
+                        continue
+                    window = bytes(buf[:nl])
+                    del buf[:nl + 1]
+                    if progress_callback and total_duration_sec > 0:
+                        current_us = self._latest_out_time_us(window)
+                        if current_us is not None and current_us >= 0:
+                            current_sec = current_us / 1_000_000.0
+                            pct = min((current_sec / total_duration_sec) * 100.0, 100.0)
+                            progress_callback(pct, "")
+        finally:
+            if conn is not None:
+                conn.close()
+
+    @staticmethod
+    def _latest_out_time_us(window: bytes) -> Optional[int]:
+        """
+        Extracts the most recent progress timestamp (microseconds) from a
+        chunk of `-progress` output, skipping intermediate updates. Prefers
+        `out_time_us`; `out_time_ms` from older builds is also microseconds
+        despite its name.
+        """
+        idx = window.rfind(b'out_time_us=')
+        if idx == -1:
+            idx = window.rfind(b'out_time_ms=')
+        if idx == -1:
+            return None
+        start = window.index(b'=', idx) + 1
+        end = window.find(b'\n', start)
+        if end == -1:
+            end = len(window)
+        try:
+            return int(window[start:end])
+        except ValueError:
+            return None
+
+    def capture_single_frame(self, cmd: list) -> Optional[bytes]:
+        """
+        Executes an instantaneous command like frame extraction without
+        progress piping. The frame is read straight from FFmpeg's stdout
+        (`image2pipe`), so no temp file is written or cleaned up.
+        Returns the encoded frame bytes, or None on failure.
+        """
+        try:
+            # Popen instead of subprocess.run so cancel() can terminate a
+            # frame render that a newer preview request has obsoleted.
+            self._process = subprocess.Popen(
                 cmd,
-                stdout=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
-                timeout=30,
+                close_fds=False,    # enables the posix_spawn fast path
             )
-            if result.returncode != 0:
-                print(f"Frame Extract Error: {result.stderr.decode(errors='replace')}")
-                return False
-            return True
-        except subprocess.CalledProcessError as e:
-            print(f"Frame Extract Error: {e.stderr.decode(errors='replace') if e.stderr else str(e)}")
-            return False
-        except subprocess.TimeoutExpired:
-            print("Frame extraction timed out.")
-            return False
+            try:
+                stdout, stderr = self._process.communicate(timeout=30)
+            except subprocess.TimeoutExpired:
+                self._process.kill()
+                self._process.communicate()
+                print("Frame extraction timed out.")
+                return None
+            if self._cancelled:
+                return None         # superseded: drop silently
+            if self._process.returncode != 0 or not stdout:
+                print(f"Frame Extract Error: {stderr.decode(errors='replace')}")
+                return None
+            return stdout
+        except Exception as e:
+            print(f"Frame Extract Error: {e}")
+            return None
+        finally:
+            self._process = None
 
     def cancel(self):
         """Immediately terminates the running FFmpeg instance."""
@@ -139,3 +273,9 @@ class FFmpegRunner:
                 self._process.terminate()
             except Exception:
                 pass
+        wake_w = self._wake_w
+        if wake_w is not None:
+            try:
+                os.write(wake_w, b"x")
+            except OSError:
+                pass
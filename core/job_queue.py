@@ -1,5 +1,7 @@
+import os
 import threading
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from typing import Callable
 
 from core.ffmpeg_builder import FFmpegBuilder
@@ -7,19 +9,44 @@ from core.ffmpeg_runner import FFmpegRunner, RenderResult
 from core.subtitle_manager import SubtitleManager
 
 
+# How many encoder threads each libx264/libx265 job may grab. Worker count
+# is derived from this so N concurrent jobs roughly fill the machine
+# instead of oversubscribing it.
+THREADS_PER_JOB = 4
+MAX_CONCURRENT_JOBS = max(1, (os.cpu_count() or 2) // THREADS_PER_JOB)
+
+
 class JobQueue:
     """
-    Background worker thread that sequences rendering tasks.
+    Thread-pool backed queue that runs rendering tasks concurrently.
     States: pending → running → completed | failed | cancelled
+
+    Up to MAX_CONCURRENT_JOBS FFmpeg processes run at once; each job gets
+    its own runner and subtitle manager so cancellation and temp-file
+    cleanup stay per-job.
     """
 
     def __init__(self, callback: Callable[[float, str], None]):
         self._queue: list = []
-        self._current_job = None
-        self._worker_thread = None
-        self._runner = FFmpegRunner()
-        self._subtitle_manager = SubtitleManager()
+        self._active: dict = {}          # job_id -> (job, runner)
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=MAX_CONCURRENT_JOBS,
+            thread_name_prefix="render",
+        )
         self._progress_callback = callback
+        # Set whenever no jobs are pending or running; lets callers block
+        # on completion instead of polling queue internals.
+        self.finished_event = threading.Event()
+        self.finished_event.set()
+
+    @property
+    def _current_job(self):
+        """Any currently-running job, or None (kept for callers that poll)."""
+        with self._lock:
+            for job, _runner in self._active.values():
+                return job
+        return None
 
     def add_job(
         self,
@@ -34,7 +61,7 @@ class JobQueue:
         resolution: str = "1920x1080",
     ) -> str:
         job_id = str(uuid.uuid4())
-        self._queue.append({
+        job = {
             "id":       job_id,
             "input":    input_video,
             "subtitle": subtitle_path,
@@ -46,24 +73,41 @@ class JobQueue:
             "quality":  quality,
             "resolution": resolution,
             "state":    "pending",
-        })
-        if not self._worker_thread or not self._worker_thread.is_alive():
-            self._start_worker()
+        }
+        with self._lock:
+            self._queue.append(job)
+            self.finished_event.clear()
+        self._executor.submit(self._run_single_job, job)
         return job_id
 
-    def _start_worker(self):
-        self._worker_thread = threading.Thread(
-            target=self._process_queue, daemon=False
-        )
-        self._worker_thread.start()
+    @staticmethod
+    def _group_key(job: dict) -> tuple:
+        return (job["bg_color"], job["styles"], job["codec"],
+                job["quality"], job["resolution"])
 
-    def _process_queue(self):
-        while self._queue:
-            job = self._queue.pop(0)
-            self._current_job = job
-            job["state"] = "running"
-            try:
-                temp_sub = self._subtitle_manager.create_safe_copy(job["subtitle"])
+    def _run_single_job(self, job: dict):
+        runner = FFmpegRunner()
+        subtitle_manager = SubtitleManager()
+        with self._lock:
+            if job["state"] != "pending":     # cleared before it started
+                # This path skips the finally block below, so waiters must
+                # be released here if nothing is left to run.
+                if not self._queue and not self._active:
+                    self.finished_event.set()
+                return
+            # Claim every still-pending job sharing this job's style/codec
+            # settings so one FFmpeg invocation renders the whole batch,
+            # amortizing process startup and libass font scanning.
+            key = self._group_key(job)
+            batch = [job] + [j for j in self._queue
+                             if j is not job and self._group_key(j) == key]
+            for j in batch:
+                self._queue.remove(j)
+                j["state"] = "running"
+                self._active[j["id"]] = (j, runner)
+        try:
+            if len(batch) == 1:
+                temp_sub = subtitle_manager.create_safe_copy(job["subtitle"])
                 cmd = FFmpegBuilder.build_burn_command(
                     job["input"], temp_sub, job["output"],
                     job["bg_color"], job["styles"],
@@ -71,27 +115,62 @@ class JobQueue:
                     duration_sec=job["duration"],
                     quality=job["quality"],
                     resolution=job["resolution"],
+                    threads=THREADS_PER_JOB,
                 )
-                res: RenderResult = self._runner.run_command(
-                    cmd, job["duration"], self._progress_callback
+                total_duration = job["duration"]
+            else:
+                entries = [{
+                    "input":    j["input"],
+                    "safe_sub": subtitle_manager.create_safe_copy(j["subtitle"]),
+                    "output":   j["output"],
+                    "duration": j["duration"],
+                } for j in batch]
+                cmd = FFmpegBuilder.build_batch_burn_command(
+                    entries, job["bg_color"], job["styles"],
+                    video_codec=job["codec"],
+                    quality=job["quality"],
+                    resolution=job["resolution"],
+                    threads=THREADS_PER_JOB,
                 )
-                if res.success:
-                    job["state"] = "completed"
-                    self._progress_callback(101.0, "Success")
-                else:
-                    job["state"] = "cancelled" if "cancelled" in res.error_message.lower() else "failed"
-                    self._progress_callback(-1.0, res.error_message)
-            except Exception as e:
-                job["state"] = "failed"
-                self._progress_callback(-1.0, str(e))
-            finally:
-                self._subtitle_manager.cleanup()
-                self._current_job = None
+                # Overall out_time tracks the longest output in the batch.
+                total_duration = max(j["duration"] for j in batch)
+            res: RenderResult = runner.run_command(
+                cmd, total_duration, self._progress_callback
+            )
+            if res.success:
+                for j in batch:
+                    j["state"] = "completed"
+                self._progress_callback(101.0, "Success")
+            else:
+                state = "cancelled" if "cancelled" in res.error_message.lower() else "failed"
+                for j in batch:
+                    j["state"] = state
+                self._progress_callback(-1.0, res.error_message)
+        except Exception as e:
+            for j in batch:
+                j["state"] = "failed"
+            self._progress_callback(-1.0, str(e))
+        finally:
+            subtitle_manager.cleanup()
+            with self._lock:
+                for j in batch:
+                    self._active.pop(j["id"], None)
+                if not self._queue and not self._active:
+                    self.finished_event.set()
 
     def cancel_current_job(self):
-        if self._current_job and self._current_job["state"] == "running":
-            self._runner.cancel()
+        with self._lock:
+            runners = [runner for _job, runner in self._active.values()]
+        for runner in runners:
+            runner.cancel()
 
     def clear_queue(self):
-        self._queue.clear()
+        with self._lock:
+            for job in self._queue:
+                job["state"] = "cancelled"
+            self._queue.clear()
+            # Cancelled jobs whose workers never started won't reach the
+            # worker's finally block; release finished_event waiters now.
+            if not self._active:
+                self.finished_event.set()
         self.cancel_current_job()
@@ -1,3 +1,4 @@
+import functools
 import os
 from typing import Dict, Any, Optional
 
@@ -7,43 +8,28 @@ class MediaEngine:
 
     @staticmethod
     def get_media_info(filepath: str) -> Dict[str, Any]:
+        """
+        Probes a media file with ffprobe. Results are cached on
+        (path, mtime, size) so repeated previews of the same source cost a
+        dict lookup instead of a process spawn.
+        """
         try:
-            import ffmpeg
-            probe = ffmpeg.probe(filepath)
-        except ImportError:
-            return MediaEngine._probe_fallback(filepath)
-        except Exception as e:
-            print(f"FFprobe error: {e}")
+            st = os.stat(filepath)
+        except OSError:
             return {}
-
-        video_stream = next((s for s in probe['streams'] if s['codec_type'] == 'video'), None)
-        audio_stream = next((s for s in probe['streams'] if s['codec_type'] == 'audio'), None)
-
-        info: Dict[str, Any] = {
-            'format':      probe['format'].get('format_name', 'unknown'),
-            'duration':    float(probe['format'].get('duration', 0.0)),
-            'size':        int(probe['format'].get('size', 0)),
-            'video_codec': video_stream['codec_name'] if video_stream else None,
-            'audio_codec': audio_stream['codec_name'] if audio_stream else None,
-        }
-        if video_stream:
-            info['width']  = int(video_stream.get('width', 0))
-            info['height'] = int(video_stream.get('height', 0))
-            fps_str = video_stream.get('r_frame_rate', '0/1')
-            try:
-                num, den = map(int, fps_str.split('/'))
-                info['fps'] = num / den if den else 0.0
-            except Exception:
-                info['fps'] = 0.0
-        return info
+        return dict(MediaEngine._probe(filepath, st.st_mtime_ns, st.st_size))
 
     @staticmethod
-    def _probe_fallback(filepath: str) -> Dict[str, Any]:
+    @functools.lru_cache(maxsize=256)
+    def _probe(filepath: str, _mtime_ns: int, _size: int) -> Dict[str, Any]:
         import subprocess, json
         try:
             result = subprocess.run(
                 ["ffprobe", "-v", "quiet", "-print_format", "json",
-                 "-show_format", "-show_streams", filepath],
+                 "-show_entries",
+                 "format=format_name,duration,size:"
+                 "stream=codec_type,codec_name,width,height,r_frame_rate",
+                 filepath],
                 capture_output=True, text=True, timeout=15,
             )
             data = json.loads(result.stdout)
@@ -61,46 +47,157 @@ class MediaEngine:
             if vs:
                 info['width']  = int(vs.get('width', 0))
                 info['height'] = int(vs.get('height', 0))
-                fps_str = vs.get('r_frame_rate', '0/1')
-                try:
-                    num, den = map(int, fps_str.split('/'))
-                    info['fps'] = num / den if den else 0.0
-                except Exception:
-                    info['fps'] = 0.0
+                info['fps'] = MediaEngine._parse_fps(vs.get('r_frame_rate', '0/1'))
             return info
         except Exception as e:
-            print(f"ffprobe fallback error: {e}")
+            print(f"ffprobe error: {e}")
             return {}
 
+    @staticmethod
+    def _parse_fps(fps_str: str) -> float:
+        """
+        Parses ffprobe's 'num/den' rational without building an
+        intermediate list (partition instead of split + map).
+        """
+        num, sep, den = fps_str.partition('/')
+        try:
+            if not sep:
+                return float(num)
+            d = int(den)
+            return int(num) / d if d else 0.0
+        except ValueError:
+            return 0.0
+
     @staticmethod
     def extract_preview_frame(
         video_path: str,
         subtitle_path: Optional[str],
         time_sec: float,
-        output_path: str,
         sub_styles: str = "",
         bg_hex: str = "00FF00",
         resolution: str = "1920x1080",
-    ) -> bool:
+        preview_size: Optional[str] = None,
+        runner=None,
+    ) -> Optional[bytes]:
+        """
+        Renders one preview frame and returns it as PPM bytes piped
+        straight from FFmpeg — no temp file round-trip. Callers may
+        pass their own FFmpegRunner so the render can be cancelled from
+        another thread, and `preview_size` ("WxH") to render at the
+        displayed size instead of the full output resolution.
+        """
         from core.ffmpeg_builder import FFmpegBuilder
         from core.ffmpeg_runner import FFmpegRunner
         from core.subtitle_manager import SubtitleManager
 
-        sm = SubtitleManager()
         try:
             temp_sub = None
             if subtitle_path and os.path.exists(subtitle_path):
-                temp_sub = sm.create_safe_copy(subtitle_path)
+                st = os.stat(subtitle_path)
+                temp_sub = MediaEngine._preview_safe_sub(
+                    subtitle_path, st.st_mtime_ns, st.st_size
+                )
             cmd = FFmpegBuilder.build_preview_command(
-                video_path, temp_sub, output_path,
-                time_sec, sub_styles, bg_hex, resolution,
+                video_path, temp_sub,
+                time_sec, sub_styles, bg_hex, resolution, preview_size,
             )
-            return FFmpegRunner().capture_single_frame(cmd)
+            return (runner or FFmpegRunner()).capture_single_frame(cmd)
         except Exception as e:
             print(f"Preview error: {e}")
-            return False
-        finally:
-            sm.cleanup()
+            return None
+
+    @staticmethod
+    def extract_preview_frames_bulk(
+        video_path: str,
+        subtitle_path: Optional[str],
+        times: list,
+        sub_styles: str = "",
+        bg_hex: str = "00FF00",
+        resolution: str = "1920x1080",
+        preview_size: Optional[str] = None,
+        runner=None,
+    ) -> Optional[list]:
+        """
+        Renders several preview frames in one FFmpeg invocation (used to
+        prefetch around a scrub position). Returns a list of
+        (time_sec, ppm_bytes) pairs on the quantized 25 fps grid, or None.
+        """
+        from core.ffmpeg_builder import FFmpegBuilder
+        from core.ffmpeg_runner import FFmpegRunner
+
+        try:
+            temp_sub = None
+            if subtitle_path and os.path.exists(subtitle_path):
+                st = os.stat(subtitle_path)
+                temp_sub = MediaEngine._preview_safe_sub(
+                    subtitle_path, st.st_mtime_ns, st.st_size
+                )
+            frame_numbers = FFmpegBuilder.quantize_preview_times(times)
+            if not frame_numbers:
+                return None
+            cmd = FFmpegBuilder.build_preview_batch_command(
+                video_path, temp_sub, frame_numbers,
+                sub_styles, bg_hex, resolution, preview_size,
+            )
+            data = (runner or FFmpegRunner()).capture_single_frame(cmd)
+            if not data:
+                return None
+            frames = MediaEngine._split_ppm(data)
+            if len(frames) != len(frame_numbers):
+                return None
+            fps = FFmpegBuilder.PREVIEW_FPS
+            return [(n / fps, jpg) for n, jpg in zip(frame_numbers, frames)]
+        except Exception as e:
+            print(f"Preview error: {e}")
+            return None
+
+    @staticmethod
+    def _split_ppm(data: bytes) -> list:
+        """
+        Splits concatenated binary PPM frames. Each frame's length is
+        fully determined by its `P6 <w> <h> <maxval>` header, so the walk
+        is exact — no marker scanning through pixel data.
+        """
+        frames = []
+        pos = 0
+        n = len(data)
+        while pos < n and data.startswith(b'P6', pos):
+            i = pos + 2
+            fields = []
+            while len(fields) < 3 and i < n:
+                while i < n and data[i:i + 1].isspace():
+                    i += 1
+                start = i
+                while i < n and not data[i:i + 1].isspace():
+                    i += 1
+                fields.append(int(data[start:i]))
+            i += 1                      # single whitespace after maxval
+            w, h, _maxval = fields
+            end = i + w * h * 3
+            if end > n:
+                break                   # truncated trailing frame
+            frames.append(data[pos:end])
+            pos = end
+        return frames
+
+    # Persistent manager behind _preview_safe_sub; owns the cached safe
+    # copies for the process lifetime and removes them on interpreter exit.
+    _preview_sub_manager = None
+
+    @staticmethod
+    @functools.lru_cache(maxsize=8)
+    def _preview_safe_sub(subtitle_path: str, _mtime_ns: int, _size: int) -> str:
+        """
+        Normalising and copying the subtitle is the dominant fixed cost of
+        a preview request once frames stream through stdout; scrubbing used
+        to redo it for every frame. Cache the safe copy on (path, mtime,
+        size) — the same keying _probe uses — so an open subtitle is
+        normalised once and re-normalised only when it changes on disk.
+        """
+        from core.subtitle_manager import SubtitleManager
+        if MediaEngine._preview_sub_manager is None:
+            MediaEngine._preview_sub_manager = SubtitleManager()
+        return MediaEngine._preview_sub_manager.create_safe_copy(subtitle_path)
 
     _global_queue = None
 
@@ -1,8 +1,68 @@
+import functools
 import os
 import re
 import uuid
 import tempfile
 
+try:
+    # Optional compiled accelerator (see core/_srt_fast.pyx). Byte-walks the
+    # raw buffer in C; worthwhile for very large SRTs.
+    from core._srt_fast import normalize_srt as _normalize_srt_fast
+except ImportError:
+    _normalize_srt_fast = None
+
+try:
+    # Optional: lets _normalise_srt convert every timecode in one
+    # vectorized pass instead of per-cue int() arithmetic.
+    import numpy as _np
+except ImportError:
+    _np = None
+
+try:
+    # Optional charset detectors, consulted only after the UTF-8 fast
+    # path fails. charset-normalizer is preferred; chardet is the
+    # slower classic fallback.
+    from charset_normalizer import from_bytes as _cn_from_bytes
+except ImportError:
+    _cn_from_bytes = None
+try:
+    import chardet as _chardet
+except ImportError:
+    _chardet = None
+
+# Place value of each digit in a packed "HHMMSSmmm" timecode.
+_TC_DIGIT_WEIGHTS = (36_000_000, 3_600_000, 600_000, 60_000,
+                     10_000, 1_000, 100, 10, 1)
+
+# Below this cue count the numpy set-up overhead outweighs the win.
+_VECTORIZE_MIN_CUES = 64
+
+# Paths made of these characters pass through FFmpeg filter arguments
+# verbatim — no backslash/colon/quote escaping needed.
+_SAFE_PATH_RE = re.compile(r'^[A-Za-z0-9_/.\-]+$')
+
+
+@functools.lru_cache(maxsize=1)
+def _escape_free_tmpdir() -> str:
+    """
+    Picks a temp directory whose path needs no FFmpeg filter escaping, so
+    the generated subtitle paths never hit the escaping code at all.
+    Resolved once per process; every safe copy after the first skips the
+    gettempdir() env/tmpdir probing.
+
+    On Linux, /dev/shm is preferred: safe copies are rewritten on every
+    subtitle change and re-read by every FFmpeg invocation, so a
+    RAM-backed directory keeps that churn off spinning disks entirely.
+    """
+    if os.path.isdir('/dev/shm') and os.access('/dev/shm', os.W_OK):
+        return '/dev/shm'
+    base = tempfile.gettempdir()
+    if _SAFE_PATH_RE.match(base):
+        return base
+    if os.path.isdir('/tmp'):
+        return '/tmp'
+    return base
+
 
 class SubtitleManager:
     """
@@ -38,14 +98,24 @@ class SubtitleManager:
 
         content = self._read_any_encoding(original_path)
 
-        if ext == '.srt':
-            content = self._normalise_srt(content)
-
         safe_name = f"sub_{uuid.uuid4().hex}{ext}"
-        safe_path = os.path.join(tempfile.gettempdir(), safe_name)
+        safe_path = os.path.join(_escape_free_tmpdir(), safe_name)
 
         with open(safe_path, 'w', encoding='utf-8', newline='\n') as f:
-            f.write(content)
+            if ext == '.srt' and _normalize_srt_fast is None:
+                # Stream normalised blocks straight to disk instead of
+                # materializing the whole document as a second string.
+                wrote_any = False
+                for block in self._iter_normalised_blocks(content):
+                    if wrote_any:
+                        f.write('\n\n')
+                    f.write(block)
+                    wrote_any = True
+                f.write('\n')
+            else:
+                if ext == '.srt':
+                    content = self._normalise_srt(content)
+                f.write(content)
 
         self.temp_files.append(safe_path)
         return safe_path
@@ -80,18 +150,41 @@ class SubtitleManager:
     # Private helpers
     # ------------------------------------------------------------------
 
-    _ENCODINGS = ['utf-8-sig', 'utf-8', 'utf-16', 'windows-1250', 'iso-8859-1', 'cp1252']
+    _LEGACY_ENCODINGS = ('utf-16', 'windows-1250', 'iso-8859-1', 'cp1252')
 
     def _read_any_encoding(self, path: str) -> str:
-        for enc in self._ENCODINGS:
+        # Read the bytes once; the old version re-opened and re-read the
+        # file for every candidate encoding.
+        with open(path, 'rb') as f:
+            raw = f.read()
+
+        # Fast path: virtually all subtitle files today are UTF-8
+        # (utf-8-sig also swallows a BOM when present).
+        try:
+            return raw.decode('utf-8-sig')
+        except (UnicodeDecodeError, UnicodeError):
+            pass
+
+        # Optional detectors beat guessing through a fixed encoding list
+        if _cn_from_bytes is not None:
+            best = _cn_from_bytes(raw).best()
+            if best is not None:
+                return str(best)
+        elif _chardet is not None:
+            enc = _chardet.detect(raw).get('encoding')
+            if enc:
+                try:
+                    return raw.decode(enc)
+                except (UnicodeDecodeError, UnicodeError, LookupError):
+                    pass
+
+        for enc in self._LEGACY_ENCODINGS:
             try:
-                with open(path, 'r', encoding=enc) as f:
-                    return f.read()
+                return raw.decode(enc)
             except (UnicodeDecodeError, UnicodeError):
                 continue
-        # Last-resort: read as bytes, decode with replacement
-        with open(path, 'rb') as f:
-            return f.read().decode('utf-8', errors='replace')
+        # Last-resort: decode with replacement
+        return raw.decode('utf-8', errors='replace')
 
     # Matches SRT timecode line:  HH:MM:SS,mmm --> HH:MM:SS,mmm
     # Tolerates extra spaces around '-->' and both ',' and '.' as ms separator
@@ -101,11 +194,50 @@ class SubtitleManager:
         r'(\d{1,2}):(\d{2}):(\d{2})[,.](\d{1,3})'   # end
     )
 
+    # Matches a whole cue in one shot: optional cue number, timecode line,
+    # then the text block up to a blank line, the next cue header, or EOF.
+    # Lets _normalise_srt run as a single C-level scan instead of a Python
+    # loop over every line.
+    _FULL_CUE_RE = re.compile(
+        r'(\d{1,2}):(\d{2}):(\d{2})[,.](\d{1,3})'   # start
+        r'\s*-->\s*'
+        r'(\d{1,2}):(\d{2}):(\d{2})[,.](\d{1,3})'   # end
+        r'[^\n]*\n?'                                 # rest of timecode line
+        r'(.*?)'                                     # text block
+        r'(?=\n\s*\n|\n\d+\s*\n\d{1,2}:\d{2}:|\Z)',  # blank line / next cue / EOF
+        re.DOTALL,
+    )
+
     @classmethod
     def _tc_to_ms(cls, h, m, s, ms_str) -> int:
         ms = int(ms_str.ljust(3, '0'))   # pad e.g. "07" -> "070" -> 70 ms
         return (int(h) * 3600 + int(m) * 60 + int(s)) * 1000 + ms
 
+    @classmethod
+    def _batch_tc_to_ms(cls, cue_groups: list) -> list:
+        """
+        Converts the (h, m, s, ms, h, m, s, ms, ...) regex groups of many
+        cues to a list of (start_ms, end_ms) pairs. Large files go through
+        numpy: all digits are packed into one (2N, 9) uint8 matrix and
+        converted with a single dot product against the place-value vector.
+        """
+        if _np is None or len(cue_groups) < _VECTORIZE_MIN_CUES:
+            return [
+                (cls._tc_to_ms(g[0], g[1], g[2], g[3]),
+                 cls._tc_to_ms(g[4], g[5], g[6], g[7]))
+                for g in cue_groups
+            ]
+
+        packed = ''.join(
+            g[0].zfill(2) + g[1] + g[2] + g[3].ljust(3, '0') +
+            g[4].zfill(2) + g[5] + g[6] + g[7].ljust(3, '0')
+            for g in cue_groups
+        )
+        digits = _np.frombuffer(packed.encode('ascii'), dtype=_np.uint8)
+        digits = digits.reshape(-1, 9).astype(_np.int64) - ord('0')
+        ms = digits @ _np.asarray(_TC_DIGIT_WEIGHTS, dtype=_np.int64)
+        return list(zip(ms[0::2].tolist(), ms[1::2].tolist()))
+
     @classmethod
     def _ms_to_srt_tc(cls, ms: int) -> str:
         h, rem = divmod(ms, 3_600_000)
@@ -126,78 +258,59 @@ class SubtitleManager:
         This fixes the common case where libass silently drops cues whose
         hour component is non-zero or whose ms field has fewer than 3 digits.
         """
-        content = content.replace('\r\n', '\n').replace('\r', '\n').strip()
-
-        lines = content.split('\n')
-        out_blocks = []
-        cue_index = 0
+        if _normalize_srt_fast is not None:
+            return _normalize_srt_fast(content.encode('utf-8')).decode('utf-8')
 
-        i = 0
-        while i < len(lines):
-            # Skip blank lines between cues
-            if not lines[i].strip():
-                i += 1
-                continue
+        return '\n\n'.join(self._iter_normalised_blocks(content)) + '\n'
 
-            # Expect a cue number (may be absent in some malformed SRTs)
-            maybe_num = lines[i].strip()
-            if maybe_num.isdigit():
-                i += 1
-                if i >= len(lines):
-                    break
-            # else: line is not a number – treat as timecode directly
-
-            # Expect timecode line
-            tc_line = lines[i].strip() if i < len(lines) else ''
-            tc_match = self._TC_RE.search(tc_line)
-            if not tc_match:
-                # Not a valid cue start – skip line
-                i += 1
-                continue
-
-            i += 1
-            start_ms = self._tc_to_ms(*tc_match.group(1, 2, 3, 4))
-            end_ms   = self._tc_to_ms(*tc_match.group(5, 6, 7, 8))
-
-            # Collect text lines until blank line or next cue number
-            text_lines = []
-            while i < len(lines):
-                l = lines[i]
-                if not l.strip():
-                    break
-                # Stop if this looks like the next cue number
-                if l.strip().isdigit() and i + 1 < len(lines) and self._TC_RE.search(lines[i + 1]):
-                    break
-                text_lines.append(l)
-                i += 1
+    def _iter_normalised_blocks(self, content: str):
+        """
+        Yields canonical cue blocks one at a time so callers can stream
+        them (create_safe_copy writes blocks straight to the temp file
+        without building the whole normalised document in memory).
+        """
+        content = content.replace('\r\n', '\n').replace('\r', '\n').strip()
 
-            if not text_lines:
-                text_lines = ['']   # libass needs at least an empty text line
+        cue_groups = [m.groups() for m in self._FULL_CUE_RE.finditer(content)]
+        times = self._batch_tc_to_ms(cue_groups)
 
-            cue_index += 1
+        for cue_index, (groups, (start_ms, end_ms)) in enumerate(zip(cue_groups, times), 1):
+            text = groups[8].strip('\n')
             tc_out = f"{self._ms_to_srt_tc(start_ms)} --> {self._ms_to_srt_tc(end_ms)}"
-            block = f"{cue_index}\n{tc_out}\n" + '\n'.join(text_lines)
-            out_blocks.append(block)
-
-        return '\n\n'.join(out_blocks) + '\n'
+            yield f"{cue_index}\n{tc_out}\n{text}"
 
     def _parse_normalised_srt(self, content: str) -> list:
-        """Parse already-normalised SRT into a list of cue dicts."""
+        """
+        Parse already-normalised SRT into a list of cue dicts.
+
+        Splits the content into lines exactly once and walks them by
+        index, instead of the old nested split('\\n\\n') / split('\\n')
+        which re-copied every block.
+        """
         cues = []
-        for block in content.strip().split('\n\n'):
-            lines = block.strip().split('\n')
-            if len(lines) < 3:
+        lines = content.splitlines()
+        n = len(lines)
+        i = 0
+        while i < n:
+            if not lines[i]:               # blank separators between cues
+                i += 1
                 continue
-            tc_match = self._TC_RE.search(lines[1])
+            tc_match = self._TC_RE.search(lines[i + 1]) if i + 1 < n else None
             if not tc_match:
+                i += 1
+                continue
+            i += 2
+            text_start = i
+            while i < n and lines[i]:
+                i += 1
+            if i == text_start:            # cue without text – skip
                 continue
             start_ms = self._tc_to_ms(*tc_match.group(1, 2, 3, 4))
             end_ms   = self._tc_to_ms(*tc_match.group(5, 6, 7, 8))
-            text = '\n'.join(lines[2:])
             cues.append({
                 'index': len(cues) + 1,
                 'start_ms': start_ms,
                 'end_ms': end_ms,
-                'text': text,
+                'text': '\n'.join(lines[text_start:i]),
             })
         return cues
@@ -1,8 +1,22 @@
 import subprocess
+
+PATTERNS = (b'Error', b'No such', b'Unable')
+
+def run_ffmpeg_stream(cmd, patterns=PATTERNS):
+    """Streams stderr and prints only interesting lines; stdout discarded."""
+    proc = subprocess.Popen(
+        cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+        bufsize=1 << 16,
+    )
+    for line in proc.stderr:
+        if any(p in line for p in patterns):
+            print(line.rstrip().decode('utf-8', 'replace'))
+    return proc.wait()
+
 cmd = [
     "ffmpeg", "-y", "-f", "lavfi", "-i", "color=c=green:s=1280x720:d=2",
     "-filter_complex", "[0:v]subtitles=test.srt:force_style='FontName=Arial,FontSize=50,PrimaryColour=&H000000FF'[v]",
     "-map", "[v]", "out_debug.mp4"
 ]
-result = subprocess.run(cmd, capture_output=True, text=True)
-print(result.stderr)
+rc = run_ffmpeg_stream(cmd)
+print("exit code:", rc)
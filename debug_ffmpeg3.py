@@ -1,8 +1,27 @@
 import subprocess
+
+PATTERNS = (b'Error', b'No such', b'Unable')
+
+def run_ffmpeg_stream(cmd, patterns=PATTERNS):
+    """
+    Streams stderr line by line and prints only the lines of interest,
+    instead of buffering the full multi-KB ffmpeg output in memory.
+    stdout is discarded; stderr stays bytes so only matched lines are
+    ever decoded.
+    """
+    proc = subprocess.Popen(
+        cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+        bufsize=1 << 16,
+    )
+    for line in proc.stderr:
+        if any(p in line for p in patterns):
+            print(line.rstrip().decode('utf-8', 'replace'))
+    return proc.wait()
+
 cmd = [
     "ffmpeg", "-y", "-f", "lavfi", "-i", "color=c=green:s=1280x720:d=2",
     "-filter_complex", "[0:v]subtitles='test.srt':force_style='FontName=Arial,FontSize=50'[v]",
     "-map", "[v]", "out_debug3.mp4"
 ]
-result = subprocess.run(cmd, capture_output=True, text=True)
-print(result.stderr)
+rc = run_ffmpeg_stream(cmd)
+print("exit code:", rc)
@@ -1,11 +1,29 @@
 import subprocess
+
+PATTERNS = (b'Error', b'No such', b'Unable')
+
+# Full filtergraph escape set in one translate table: a single C-level
+# pass over the string, and it covers : = ' [ ] \ too, not just commas.
+_FILTER_ESCAPE = str.maketrans({c: '\\' + c for c in "\\:,='[]"})
+
+def run_ffmpeg_stream(cmd, patterns=PATTERNS):
+    """Streams stderr as bytes, decoding only matched lines; stdout discarded."""
+    proc = subprocess.Popen(
+        cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+        bufsize=1 << 16,
+    )
+    for line in proc.stderr:
+        if any(p in line for p in patterns):
+            print(line.rstrip().decode('utf-8', 'replace'))
+    return proc.wait()
+
 force_style = 'FontName=Arial,FontSize=50,PrimaryColour=&H000000FF'
-escaped_style = force_style.replace(',', '\\,')
+escaped_style = force_style.translate(_FILTER_ESCAPE)
 cmd = [
     'ffmpeg', '-y', '-f', 'lavfi', '-i', 'color=c=green:s=1280x720:d=2',
     '-filter_complex', f'[0:v]subtitles=test.srt:force_style={escaped_style}[v]',
     '-map', '[v]', 'out_debug5.mp4'
 ]
 print(cmd)
-result = subprocess.run(cmd, capture_output=True, text=True)
-print(result.stderr)
+rc = run_ffmpeg_stream(cmd)
+print("exit code:", rc)
@@ -1,13 +1,22 @@
 import os
 import shutil
+import subprocess
 from core.job_queue import JobQueue
 from core.media_engine import MediaEngine
 
 def progress_callback(pct, msg=""):
     print(f"Progress: {pct}% {msg}")
 
-# Create dummy input video
-os.system('ffmpeg -y -f lavfi -i testsrc=duration=5:size=1280x720:rate=25 -f lavfi -i sine=frequency=1000:duration=5 -c:v libx264 -c:a aac /tmp/dummy_in.mp4 > /dev/null 2>&1')
+# Create dummy input video once; it is deterministic, so reuse the cached
+# copy on later runs instead of paying the libx264 encode every time.
+if not os.path.exists('/tmp/dummy_in.mp4'):
+    subprocess.run(
+        ['ffmpeg', '-y',
+         '-f', 'lavfi', '-i', 'testsrc=duration=5:size=1280x720:rate=25',
+         '-f', 'lavfi', '-i', 'sine=frequency=1000:duration=5',
+         '-c:v', 'libx264', '-c:a', 'aac', '/tmp/dummy_in.mp4'],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True,
+    )
 
 # Create dummy sub
 srt_content = "1\n00:00:00,000 --> 00:00:05,000\nHiiiiii\n"
@@ -24,9 +33,7 @@ q.add_job(
     duration=5.0
 )
 
-# wait for thread to finish
-import time
-while len(q._queue) > 0 or q._current_job is not None:
-    time.sleep(1)
+# Block until the queue drains instead of polling its internals
+q.finished_event.wait(timeout=600)
 
 print("Done. Output size:", os.path.getsize("/tmp/dummy_out.mp4"))
@@ -1,44 +1,71 @@
+import re
 import subprocess
 import os
 
+# Single compiled alternation replaces per-line substring scanning
+ERR_RE = re.compile(rb'(?:No such filter|Error|Unable to)[^\n]*')
+
 srt_content = "1\n00:00:00,000 --> 00:00:05,000\nHello World\n"
-with open('/tmp/test_sub.srt', 'w') as f: f.write(srt_content)
+if not os.path.exists('/tmp/test_sub.srt'):
+    with open('/tmp/test_sub.srt', 'w') as f: f.write(srt_content)
+
+# Shared filter template; each case only varies the path/style tokens,
+# so the graph string is built in one format() per case instead of a
+# hand-written f-string each.
+SUB = '/tmp/test_sub.srt'
+TEMPLATE = "[0:v]subtitles={path}:force_style={style}[v]"
+
+# (name, path token, style token) escaping variants
+CASES = [
+    ("No quotes, no escape",            SUB,       "FontName=Arial,FontSize=50"),
+    ("Single quotes around value",      SUB,       "'FontName=Arial,FontSize=50'"),
+    ("Single quotes around whole arg",  f"'{SUB}'", "'FontName=Arial,FontSize=50'"),
+    # string literal '\\' produces a string with 1 backslash
+    ("Escape comma 1 backslash",        SUB,       "FontName=Arial\\,FontSize=50"),
+    ("Double Escape comma",             SUB,       "FontName=Arial\\\\,FontSize=50"),
+    ("Triple Escape comma",             SUB,       "FontName=Arial\\\\\\,FontSize=50"),
+    ("Quad Escape comma",               SUB,       "FontName=Arial\\\\\\\\,FontSize=50"),
+]
+
 
 def test(name, filter_str):
+    """Single-case fallback used to pinpoint which case broke the batch."""
     cmd = ['ffmpeg', '-y', '-f', 'lavfi', '-i', 'color=c=green:s=1280x720:d=2', '-filter_complex', filter_str, '-map', '[v]', '/tmp/out_debug.mp4']
     print(f"--- {name} ---")
     print("Filter:", filter_str)
-    res = subprocess.run(cmd, capture_output=True, text=True)
-    if 'No such filter' in res.stderr:
-        for line in res.stderr.split('\n'):
-            if 'No such filter' in line:
-                print("Error:", line.strip())
-    elif 'Error' in res.stderr:
-        print("Failed with other error")
-        for line in res.stderr.split('\n'):
-            if 'Error' in line or 'Unable to' in line:
-                print("Error:", line.strip())
+    res = subprocess.run(cmd, capture_output=True)
+    matches = ERR_RE.findall(res.stderr)
+    if matches:
+        for line in matches:
+            print('Error:', line.strip().decode('utf-8', 'replace'))
     else:
         print("SUCCESS")
 
-# 1. No quotes, no escaping
-test("No quotes, no escape", "[0:v]subtitles=/tmp/test_sub.srt:force_style=FontName=Arial,FontSize=50[v]")
-
-# 2. Quotes around force_style value
-test("Single quotes around value", "[0:v]subtitles=/tmp/test_sub.srt:force_style='FontName=Arial,FontSize=50'[v]")
-
-# 3. Quotes around whole subtitles arg
-test("Single quotes around whole arg", "[0:v]subtitles='/tmp/test_sub.srt':force_style='FontName=Arial,FontSize=50'[v]")
-
-# 4. No quotes, escape commas with 1 backslash
-# string literal '\\' produces a string with 1 backslash
-test("Escape comma 1 backslash", "[0:v]subtitles=/tmp/test_sub.srt:force_style=FontName=Arial\\,FontSize=50[v]")
 
-# 5. No quotes, escape commas with 2 backslashes
-test("Double Escape comma", "[0:v]subtitles=/tmp/test_sub.srt:force_style=FontName=Arial\\\\,FontSize=50[v]")
+def test_batch(cases):
+    """
+    All cases in ONE ffmpeg process: split the colour source N ways and
+    re-target each case's filter from [0:v] to its split branch, so
+    lavfi/encoder init is paid once instead of per case.
+    """
+    n = len(cases)
+    split = f"[0:v]split={n}" + "".join(f"[s{i}]" for i in range(n))
+    parts = [split] + [
+        TEMPLATE.format(path=path, style=style)
+        .replace("[0:v]", f"[s{i}]", 1).replace("[v]", f"[v{i}]")
+        for i, (_name, path, style) in enumerate(cases)
+    ]
+    cmd = ['ffmpeg', '-y', '-f', 'lavfi', '-i', 'color=c=green:s=1280x720:d=2',
+           '-filter_complex', ';'.join(parts)]
+    for i in range(n):
+        cmd += ['-map', f'[v{i}]', f'/tmp/out_debug{i}.mp4']
+    return subprocess.run(cmd, capture_output=True)
 
-# 6. No quotes, escape commas with 3 backslashes
-test("Triple Escape comma", "[0:v]subtitles=/tmp/test_sub.srt:force_style=FontName=Arial\\\\\\,FontSize=50[v]")
 
-# 7. No quotes, escape commas with 4 backslashes
-test("Quad Escape comma", "[0:v]subtitles=/tmp/test_sub.srt:force_style=FontName=Arial\\\\\\\\,FontSize=50[v]")
+res = test_batch(CASES)
+if ERR_RE.search(res.stderr):
+    # Batch failed – fall back to per-case probes to find the culprit
+    for name, path, style in CASES:
+        test(name, TEMPLATE.format(path=path, style=style))
+else:
+    print(f"SUCCESS – all {len(CASES)} cases rendered in one pass")
@@ -1,7 +1,58 @@
-from PySide6.QtWidgets import QListWidget, QListWidgetItem, QAbstractItemView
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtWidgets import QListWidget, QListWidgetItem, QAbstractItemView, QFileIconProvider
+from PySide6.QtCore import Qt, QFileInfo, Signal
+from PySide6.QtGui import QIcon
 import os
 
+# Accepted drop types; frozenset membership beats scanning a list per URL.
+_ALLOWED_EXTS = frozenset(
+    ('.srt', '.vtt', '.ass', '.mp3', '.wav', '.m4a', '.mp4', '.mov', '.mkv')
+)
+
+# One QIcon per extension: the icon provider hits the platform theme
+# engine, so resolving it per dropped file is needlessly expensive.
+_ICON_CACHE: dict = {}
+_icon_provider = None
+
+
+def _get_icon(ext: str) -> QIcon:
+    global _icon_provider
+    icon = _ICON_CACHE.get(ext)
+    if icon is None:
+        if _icon_provider is None:
+            _icon_provider = QFileIconProvider()
+        icon = _icon_provider.icon(QFileInfo(f"dummy{ext}"))
+        _ICON_CACHE[ext] = icon
+    return icon
+
+
+# Shared stylesheet, scoped by object name so Qt parses the rules once
+# per widget instead of rebuilding the string per instance.
+_STYLESHEET = """
+    QListWidget#dragdrop {
+        background-color: #1a1a1f;
+        color: #ffffff;
+        border: 1px solid #2a2a30;
+        border-radius: 12px;
+        padding: 10px;
+        font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, Helvetica, Arial, sans-serif;
+    }
+    QListWidget#dragdrop::item {
+        padding: 12px;
+        background-color: #25252d;
+        border-radius: 8px;
+        margin-bottom: 5px;
+    }
+    QListWidget#dragdrop::item:selected {
+        background-color: #b3ff00;
+        color: #000000;
+        font-weight: bold;
+    }
+    QListWidget#dragdrop::item:hover {
+        background-color: #32323b;
+    }
+"""
+
+
 class DragDropListWidget(QListWidget):
     """Custom QListWidget accepting dragged items."""
     
@@ -9,35 +60,15 @@ class DragDropListWidget(QListWidget):
     
     def __init__(self, parent=None):
         super().__init__(parent)
+        # Mirrors the UserRole paths of current items so add_unique_items
+        # dedupes with set lookups instead of rescanning every row.
+        self._path_set = set()
         self.setAcceptDrops(True)
         self.setDragDropMode(QAbstractItemView.InternalMove)
         self.setSelectionMode(QAbstractItemView.SingleSelection)
         self.setAlternatingRowColors(True)
-        # Apply a simple stylesheet
-        self.setStyleSheet("""
-            QListWidget {
-                background-color: #1a1a1f; 
-                color: #ffffff;
-                border: 1px solid #2a2a30;
-                border-radius: 12px;
-                padding: 10px;
-                font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, Helvetica, Arial, sans-serif;
-            }
-            QListWidget::item {
-                padding: 12px;
-                background-color: #25252d;
-                border-radius: 8px;
-                margin-bottom: 5px;
-            }
-            QListWidget::item:selected {
-                background-color: #b3ff00;
-                color: #000000;
-                font-weight: bold;
-            }
-            QListWidget::item:hover {
-                background-color: #32323b;
-            }
-        """)
+        self.setObjectName("dragdrop")
+        self.setStyleSheet(_STYLESHEET)
 
     def dragEnterEvent(self, event):
         if event.mimeData().hasUrls():
@@ -62,7 +93,7 @@ class DragDropListWidget(QListWidget):
                 if url.isLocalFile():
                     file_path = url.toLocalFile()
                     ext = os.path.splitext(file_path)[1].lower()
-                    if ext in ['.srt', '.vtt', '.ass', '.mp3', '.wav', '.m4a', '.mp4', '.mov', '.mkv']:
+                    if ext in _ALLOWED_EXTS:
                         dropped_files.append(file_path)
             
             if dropped_files:
@@ -70,11 +101,25 @@ class DragDropListWidget(QListWidget):
         else:
             event.ignore()
 
+    def clear(self):
+        self._path_set.clear()
+        super().clear()
+
     def add_unique_items(self, file_paths):
-        existing_paths = [self.item(i).data(Qt.UserRole) for i in range(self.count())]
-        for path in file_paths:
-            if path not in existing_paths:
-                filename = os.path.basename(path)
-                item = QListWidgetItem(filename)
-                item.setData(Qt.UserRole, path)
-                self.addItem(item)
+        # Batch the insert: one repaint at the end instead of a relayout
+        # and item-change signal per row.
+        self.setUpdatesEnabled(False)
+        self.blockSignals(True)
+        try:
+            for path in file_paths:
+                if path not in self._path_set:
+                    self._path_set.add(path)
+                    filename = os.path.basename(path)
+                    item = QListWidgetItem(filename)
+                    item.setIcon(_get_icon(os.path.splitext(path)[1].lower()))
+                    item.setData(Qt.UserRole, path)
+                    self.addItem(item)
+        finally:
+            self.blockSignals(False)
+            self.setUpdatesEnabled(True)
+            self.viewport().update()
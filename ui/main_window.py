@@ -13,24 +13,86 @@ Features added in this revision:
 
 import os
 import platform
+import time
+from collections import OrderedDict
 
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QPushButton, QSlider, QComboBox, QColorDialog,
     QSpinBox, QProgressBar, QMessageBox, QFileDialog,
-    QGroupBox, QFormLayout, QListWidget, QListWidgetItem,
+    QGroupBox, QFormLayout, QListWidget, QListWidgetItem, QListView,
     QSplitter, QSizePolicy, QCheckBox, QFrame,
 )
 from PySide6.QtGui import (
-    QPixmap, QFontDatabase, QColor, QPainter, QPen, QBrush, QFont,
+    QPixmap, QImage, QFontDatabase, QColor, QPainter, QPen, QBrush, QFont,
     QPainterPath,
 )
-from PySide6.QtCore import Qt, QTimer, Signal, QSize, QRect, QRectF
+from PySide6.QtCore import (
+    Qt, QTimer, Signal, Slot, QSize, QRect, QRectF, QRunnable, QThreadPool,
+    QAbstractListModel, QModelIndex, QElapsedTimer,
+)
 
 from ui.drag_drop import DragDropListWidget
+from core.ffmpeg_builder import FFmpegBuilder
+from core.ffmpeg_runner import FFmpegRunner
 from core.media_engine import MediaEngine
 
 
+# Swatch buttons re-style on every colour-picker confirm; keep the QSS a
+# template so only the colour varies and no f-string machinery re-runs.
+_SWATCH_QSS = "background:{};border:1px solid #3a3a50;border-radius:5px;"
+
+# platform.processor() can fork a uname subprocess on POSIX; probe once.
+_IS_APPLE_SILICON = platform.processor() == 'arm'
+
+
+# Delay before a burst of style/timeline changes collapses into one
+# preview render; every control funnels through the same single-shot timer.
+_PREVIEW_DEBOUNCE_MS = 150
+
+# Decoded preview frames kept in memory. Scrubbing back to a recently
+# viewed position (same video/time/style) then costs a dict lookup
+# instead of an FFmpeg subprocess. ~64 frames ≈ a few hundred MB worst
+# case at 4K, far less at typical preview resolutions.
+_PREVIEW_CACHE_MAX = 64
+
+# Slider percentage → ASS alpha (0 = opaque, 255 = transparent), evaluated
+# once at import so the style rebuild does an indexed lookup instead of a
+# float divide + truncate.
+_OPACITY_LUT = tuple(int((100 - p) / 100 * 255) for p in range(101))
+
+# Style-string layout, bound once at import like the builder's
+# _FORCE_STYLE_TEMPLATE; _build_style_string only fills in the values.
+_STYLE_TEMPLATE = (
+    "FontName={FontName},"
+    "FontSize={FontSize},"
+    "Bold={Bold},"
+    "Italic={Italic},"
+    "PrimaryColour={PrimaryColour},"
+    "OutlineColour={OutlineColour},"
+    "OutlineAlpha={OutlineAlpha},"
+    "Outline={Outline},"
+    "Shadow={Shadow},"
+    "MarginV={MarginV}"
+)
+
+# Grace period before the "Loading…" indicator appears. Fast renders and
+# cache hits finish inside it, so the preview swaps straight from frame
+# to frame instead of flashing the spinner for a couple of paints.
+_LOADING_DELAY_MS = 80
+
+
+# Font enumeration hits the platform font system; do it once per process.
+_FONT_FAMILIES: list | None = None
+
+
+def _font_families() -> list:
+    global _FONT_FAMILIES
+    if _FONT_FAMILIES is None:
+        _FONT_FAMILIES = QFontDatabase.families()
+    return _FONT_FAMILIES
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # Stylesheet
 # ═══════════════════════════════════════════════════════════════════════════
@@ -131,7 +193,7 @@ QProgressBar::chunk {
         stop:0 #7acc00, stop:1 #b3ff00);
     border-radius: 6px;
 }
-QListWidget {
+QListWidget, QListView {
     background-color: #18181f;
     border: 1px solid #2b2b38;
     border-radius: 8px;
@@ -139,13 +201,13 @@ QListWidget {
     color: #e4e4e8;
     outline: none;
 }
-QListWidget::item {
+QListWidget::item, QListView::item {
     padding: 6px 10px;
     border-radius: 5px;
     margin: 1px 0;
 }
-QListWidget::item:selected { background-color: #b3ff00; color: #000; font-weight: 600; }
-QListWidget::item:hover:!selected { background-color: #26263a; }
+QListWidget::item:selected, QListView::item:selected { background-color: #b3ff00; color: #000; font-weight: 600; }
+QListWidget::item:hover:!selected, QListView::item:hover:!selected { background-color: #26263a; }
 QScrollBar:vertical {
     background: #18181f; width: 7px; border-radius: 3px;
 }
@@ -156,6 +218,19 @@ QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical { height: 0; }
 QFrame[frameShape="4"], QFrame[frameShape="5"] {   /* HLine / VLine */
     color: #2b2b38;
 }
+/* Named buttons – styled here once instead of per-widget QSS parses */
+QPushButton#RemoveBtn { color: #ff5555; border-color: #5a2222; background: #2a1818; }
+QPushButton#RemoveBtn:hover { background: #3a2020; }
+QPushButton#RemoveBtn:disabled { color: #444; border-color: #252525; background: #1b1b22; }
+QPushButton#CancelBtn { color: #ffb300; border: 1px solid #6b5200; background: #3a2c00; border-radius: 7px; padding: 6px 14px; }
+QPushButton#CancelBtn:hover { background: #6b5200; }
+QPushButton#CancelBtn:disabled { color: #484858; border-color: #252530; background: #1b1b22; }
+QPushButton#StartBtn {
+    background: qlineargradient(x1:0,y1:0,x2:1,y2:0, stop:0 #7acc00, stop:1 #b3ff00);
+    color: #000; font-weight: 700; font-size: 13px; border: none; border-radius: 8px;
+}
+QPushButton#StartBtn:hover { background: #ccff33; }
+QPushButton#StartBtn:disabled { background: #23232d; color: #484858; border: 1px solid #2b2b38; }
 """
 
 
@@ -172,10 +247,34 @@ class PreviewWidget(QWidget):
 
     def __init__(self, parent=None):
         super().__init__(parent)
-        self._pixmap: QPixmap | None = None
+        # Paint resources built once, not per repaint
+        self._bg_color      = QColor("#0a0a0e")
+        self._loading_color = QColor("#555568")
+        self._hint_color    = QColor("#404055")
+        self._msg_font      = QFont("Arial", 13)
+
+        # Frames are held as QImage: producible off the GUI thread and
+        # painted directly by the raster engine, with no pixmap upload.
+        self._image: QImage | None = None
         self._show_safe_zone = False
         self._aspect_ratio = "16:9"   # "16:9" | "9:16"
         self._loading = False
+        self._interactive = False     # True while the timeline is scrubbed
+        # (source cacheKey, target size, scaled pixmap) — smooth-scaling a
+        # 1080p frame dominates paintEvent, so reuse the result until the
+        # source or widget size changes.
+        self._scaled_cache: tuple | None = None
+        # Safe-zone overlay pre-rendered once per displayed-image size;
+        # dashed-pen stroking and label drawing are then a single blit.
+        self._safezone_pixmap: QPixmap | None = None
+        self._safezone_key: tuple | None = None
+
+        # Repaint throttle: coalesce rapid state flips (held shortcut,
+        # scripted toggling) to at most one update() per 16 ms frame.
+        self._elapsed = QElapsedTimer()
+        self._elapsed.start()
+        self._last_update_ms = -16
+        self._update_pending = False
 
         self.setMinimumSize(480, 270)
         self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
@@ -187,63 +286,127 @@ class PreviewWidget(QWidget):
 
     # ── public API ──────────────────────────────────────────────────────
 
-    def set_pixmap(self, pixmap: QPixmap):
-        self._pixmap = pixmap
-        self._loading = False
+    def _request_update(self):
+        now = self._elapsed.elapsed()
+        if now - self._last_update_ms >= 16:
+            self._last_update_ms = now
+            self.update()
+        elif not self._update_pending:
+            # Trailing update so the final state of a burst still paints
+            self._update_pending = True
+            QTimer.singleShot(16, self._flush_update)
+
+    def _flush_update(self):
+        self._update_pending = False
+        self._last_update_ms = self._elapsed.elapsed()
         self.update()
 
+    def set_image(self, image: QImage):
+        self._image = image
+        self._loading = False
+        self._scaled_cache = None
+        self._request_update()
+
+    def set_pixmap(self, pixmap: QPixmap):
+        self.set_image(pixmap.toImage())
+
     def set_loading(self, loading: bool):
+        # No-op transitions (e.g. clearing a spinner that never appeared)
+        # must not schedule a repaint.
+        if loading == self._loading and not (loading and self._image is not None):
+            return
         self._loading = loading
         if loading:
-            self._pixmap = None
-        self.update()
+            self._image = None
+            self._scaled_cache = None
+        self._request_update()
 
     def set_safe_zone(self, enabled: bool):
-        self._show_safe_zone = enabled
-        self.update()
+        if enabled != self._show_safe_zone:
+            self._show_safe_zone = enabled
+            self._request_update()
 
     def set_aspect_ratio(self, ar: str):
-        self._aspect_ratio = ar
-        self.update()
+        if ar != self._aspect_ratio:
+            self._aspect_ratio = ar
+            self._request_update()
+
+    def set_interactive(self, interactive: bool):
+        """Cheap nearest-neighbour scaling while a slider is being dragged."""
+        if self._interactive != interactive:
+            self._interactive = interactive
+            self._scaled_cache = None
+            self.update()
 
     def clear(self):
-        self._pixmap = None
+        self._image = None
         self._loading = False
-        self.update()
+        self._scaled_cache = None
+        self._request_update()
 
     # ── paint ────────────────────────────────────────────────────────────
 
     def paintEvent(self, event):
+        # Obscured widget (collapsed splitter pane, covered window) —
+        # nothing would reach the screen, so skip the scale/draw work.
+        if not self.isVisible() or self.visibleRegion().isEmpty():
+            return
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
         painter.setRenderHint(QPainter.SmoothPixmapTransform)
 
         w, h = self.width(), self.height()
 
-        # Background
-        painter.fillRect(0, 0, w, h, QColor("#0a0a0e"))
+        # Only repaint what Qt asked for; small expose events (tooltips,
+        # focus rings) then cost a clipped blit, not a full redraw.
+        dirty = event.rect()
+        painter.setClipRect(dirty)
 
-        if self._pixmap and not self._pixmap.isNull():
-            # Scale preserving aspect ratio
-            scaled = self._pixmap.scaled(
-                QSize(w, h), Qt.KeepAspectRatio, Qt.SmoothTransformation
-            )
+        # Background
+        painter.fillRect(dirty, self._bg_color)
+
+        if self._image and not self._image.isNull():
+            # Scale preserving aspect ratio; cached until the source image
+            # or widget size changes (safe-zone toggles etc. just re-blit).
+            cache_key = (self._image.cacheKey(), QSize(w, h))
+            if self._scaled_cache and self._scaled_cache[:2] == cache_key:
+                scaled = self._scaled_cache[2]
+            else:
+                src = self._image.size()
+                target = src.scaled(QSize(w, h), Qt.KeepAspectRatio)
+                if target == src:
+                    # Identity: the bilinear kernel would change nothing
+                    scaled = self._image
+                elif (self._interactive
+                      or (target.width() % src.width() == 0
+                          and target.height() % src.height() == 0)):
+                    # Integer upscale — nearest-neighbour is exact enough
+                    scaled = self._image.scaled(
+                        target, Qt.IgnoreAspectRatio, Qt.FastTransformation
+                    )
+                else:
+                    scaled = self._image.scaled(
+                        target, Qt.IgnoreAspectRatio, Qt.SmoothTransformation
+                    )
+                self._scaled_cache = (*cache_key, scaled)
             x = (w - scaled.width())  // 2
             y = (h - scaled.height()) // 2
-            painter.drawPixmap(x, y, scaled)
+            img_rect = QRect(x, y, scaled.width(), scaled.height())
+            if dirty.intersects(img_rect):
+                painter.drawImage(x, y, scaled)
 
-            if self._show_safe_zone:
-                self._draw_safe_zones(painter, x, y, scaled.width(), scaled.height())
+                if self._show_safe_zone:
+                    self._draw_safe_zones(painter, x, y, scaled.width(), scaled.height())
 
         elif self._loading:
-            painter.setPen(QColor("#555568"))
-            painter.setFont(QFont("Arial", 13))
+            painter.setPen(self._loading_color)
+            painter.setFont(self._msg_font)
             painter.drawText(
                 QRect(0, 0, w, h), Qt.AlignCenter, "Generating preview…"
             )
         else:
-            painter.setPen(QColor("#404055"))
-            painter.setFont(QFont("Arial", 13))
+            painter.setPen(self._hint_color)
+            painter.setFont(self._msg_font)
             painter.drawText(
                 QRect(0, 0, w, h), Qt.AlignCenter,
                 "Drop a video file\nor click '+ Video'"
@@ -253,16 +416,32 @@ class PreviewWidget(QWidget):
 
     def _draw_safe_zones(self, painter: QPainter, ox: int, oy: int, pw: int, ph: int):
         """
-        Draw title-safe (80 %) and action-safe (90 %) rectangle guides.
-        Coordinates are relative to the displayed image rect (ox, oy, pw, ph).
+        Blit the title-safe (80 %) / action-safe (90 %) guide overlay at the
+        displayed image rect (ox, oy, pw, ph); the overlay itself is
+        re-rendered only when that rect's size changes.
         """
-        for pct, color, label in [
-            (0.90, QColor(255, 200, 0,  160), "Action Safe 90%"),
-            (0.80, QColor(255, 80,  80,  160), "Title Safe 80%"),
-        ]:
+        key = (pw, ph)
+        if self._safezone_key != key:
+            self._safezone_key = key
+            self._safezone_pixmap = self._render_safe_zones(pw, ph)
+        painter.drawPixmap(ox, oy, self._safezone_pixmap)
+
+    # (inset fraction, colour, label) — built once, not per overlay render
+    _SAFE_ZONES = (
+        (0.90, QColor(255, 200, 0,  160), "Action Safe 90%"),
+        (0.80, QColor(255, 80,  80,  160), "Title Safe 80%"),
+    )
+
+    @classmethod
+    def _render_safe_zones(cls, pw: int, ph: int) -> QPixmap:
+        pix = QPixmap(pw, ph)
+        pix.fill(Qt.transparent)
+        painter = QPainter(pix)
+        painter.setRenderHint(QPainter.Antialiasing)
+        for pct, color, label in cls._SAFE_ZONES:
             mw = pw * (1 - pct) / 2
             mh = ph * (1 - pct) / 2
-            rect = QRectF(ox + mw, oy + mh, pw - 2*mw, ph - 2*mh)
+            rect = QRectF(mw, mh, pw - 2*mw, ph - 2*mh)
 
             pen = QPen(color, 1.2, Qt.DashLine)
             painter.setPen(pen)
@@ -277,13 +456,142 @@ class PreviewWidget(QWidget):
                 Qt.AlignLeft | Qt.AlignVCenter,
                 label,
             )
+        painter.end()
+        return pix
 
 
 # ═══════════════════════════════════════════════════════════════════════════
 # Main Window
 # ═══════════════════════════════════════════════════════════════════════════
+class CueListModel(QAbstractListModel):
+    """
+    Thin model over the cue dicts from parse_srt_cues. Compared to one
+    QListWidgetItem per cue this keeps only the parsed data, formats the
+    display label on demand, and swaps in a 10k-cue file with a single
+    model reset.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._cues: list = []
+        self._labels: list = []       # lazily formatted, parallel to _cues
+
+    def set_cues(self, cues: list):
+        self.beginResetModel()
+        self._cues = cues
+        self._labels = [None] * len(cues)
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._cues)
+
+    def data(self, index, role=Qt.DisplayRole):
+        row = index.row()
+        if not index.isValid() or row >= len(self._cues):
+            return None
+        if role == Qt.DisplayRole:
+            label = self._labels[row]
+            if label is None:
+                cue = self._cues[row]
+                # Pure integer divmod chain — no float division per row
+                s_total = cue['start_ms'] // 1000
+                h, rem = divmod(s_total, 3600)
+                m, s = divmod(rem, 60)
+                text = cue['text'].replace('\n', ' ')
+                if len(text) > 58:
+                    text = text[:55] + '…'
+                label = self._labels[row] = f"[{h:02d}:{m:02d}:{s:02d}]  {text}"
+            return label
+        if role == Qt.UserRole:
+            return self._cues[row]['start_ms'] / 1000.0
+        return None
+
+
+def _decode_frame(buf: bytes) -> QImage:
+    """
+    Decodes piped PPM bytes into the raster engine's native RGB32. PPM
+    loads as RGB888, which QPainter would otherwise convert on every
+    paint; converting once here keeps that work off the GUI thread and
+    makes each repaint a plain blit.
+    """
+    return QImage.fromData(buf).convertToFormat(QImage.Format_RGB32)
+
+
+class _PreviewTask(QRunnable):
+    """
+    Renders one preview frame off the UI thread. Results come back as a
+    QImage (safe to build off-thread, unlike QPixmap) tagged with the
+    generation that requested them, so the window can drop frames that
+    were obsoleted by a newer request.
+    """
+
+    def __init__(self, gen: int, args: tuple, done: Signal, times: list = None):
+        super().__init__()
+        self._gen = gen
+        self._args = args
+        self._done = done
+        self._times = times      # batch prefetch positions (broad scrub)
+        # Created on the GUI thread so the window can cancel() a render
+        # that a newer request has made obsolete.
+        self.runner = FFmpegRunner()
+
+    def run(self):
+        video, subtitle, time_sec, styles, bg, res, preview_size = self._args
+        if self._times:
+            # One ffmpeg emits every prefetch position; stale-by-one scrub
+            # ticks then resolve from cache instead of spawning again.
+            frames = MediaEngine.extract_preview_frames_bulk(
+                video, subtitle, self._times, styles, bg, res,
+                preview_size=preview_size, runner=self.runner,
+            )
+            result = None
+            if frames:
+                result = [(t, _decode_frame(buf)) for t, buf in frames]
+            self._done.emit(self._gen, result)
+            return
+        # Frame bytes arrive on FFmpeg's stdout; decode them in memory
+        # instead of bouncing a preview JPEG through the filesystem.
+        frame = MediaEngine.extract_preview_frame(
+            video, subtitle, time_sec, styles, bg, res,
+            preview_size=preview_size, runner=self.runner,
+        )
+        image = _decode_frame(frame) if frame else None
+        self._done.emit(self._gen, image)
+
+
+class _RenderJob(QRunnable):
+    """
+    Submits a render to the job queue off the GUI thread. render_green_sub
+    itself only enqueues, but it probes the source with ffprobe first —
+    enough to freeze the window for hundreds of ms on a cold file. Progress
+    still arrives via the window's signal, so nothing else changes.
+    """
+
+    def __init__(self, kwargs: dict):
+        super().__init__()
+        self._kwargs = kwargs
+
+    def run(self):
+        MediaEngine.render_green_sub(**self._kwargs)
+
+
+class _CueParseTask(QRunnable):
+    """Parses an SRT off the UI thread and hands the cues back via signal."""
+
+    def __init__(self, path: str, done: Signal):
+        super().__init__()
+        self._path = path
+        self._done = done
+
+    def run(self):
+        from core.subtitle_manager import SubtitleManager
+        self._done.emit(SubtitleManager().parse_srt_cues(self._path))
+
+
 class MainWindow(QMainWindow):
     render_progress_signal = Signal(float, str)
+    cues_loaded_signal = Signal(list)
+    preview_ready_signal = Signal(int, object)
 
     def __init__(self):
         super().__init__()
@@ -294,15 +602,35 @@ class MainWindow(QMainWindow):
         self.video_path:    str | None = None
         self.subtitle_path: str | None = None
         self.duration:      float = 0.0
-        self.sub_color:     str = "#FFFFFF"
-        self.outline_color: str = "#000000"
-        self.bg_color_hex:  str = "00FF00"
+        # Colours live as QColor instances; hex strings for FFmpeg/QSS are
+        # derived on demand instead of re-parsing "#RRGGBB" per use.
+        self._sub_qcolor     = QColor("#FFFFFF")
+        self._outline_qcolor = QColor("#000000")
+        self._bg_qcolor      = QColor("#00FF00")
 
         self._preview_timer = QTimer()
         self._preview_timer.setSingleShot(True)
         self._preview_timer.timeout.connect(self._do_update_preview)
 
+        self._loading_timer = QTimer()
+        self._loading_timer.setSingleShot(True)
+        self._loading_timer.setInterval(_LOADING_DELAY_MS)
+        self._loading_timer.timeout.connect(self._show_loading)
+
+        self._preview_gen = 0    # invalidates in-flight preview renders
+        self._last_pct = -1      # last percentage shown in the progress bar
+        # Memoized widget state: rebuilt only when a style control or the
+        # aspect selector actually changes, not on every preview request.
+        self._style_cache: str | None = None
+        self._resolution = "1920x1080"
+        self._preview_key = None             # cache key of the in-flight render
+        self._displayed_key = None           # cache key of the frame on screen
+        self._preview_runner = None          # runner of the in-flight render
+        self._preview_cache: OrderedDict = OrderedDict()
+
         self.render_progress_signal.connect(self._on_progress)
+        self.cues_loaded_signal.connect(self._on_cues_loaded)
+        self.preview_ready_signal.connect(self._on_preview_ready)
         self._build_ui()
 
     # ═══════════════════════════════════════════════════════════════════
@@ -323,9 +651,9 @@ class MainWindow(QMainWindow):
             "letter-spacing:-0.5px;'>GreenSub Pro</span>"
         ))
         hdr.addStretch()
-        hw = QLabel("⚡ Apple Silicon" if platform.processor() == 'arm' else "🖥 Standard CPU")
+        hw = QLabel("⚡ Apple Silicon" if _IS_APPLE_SILICON else "🖥 Standard CPU")
         hw.setStyleSheet(
-            "color:#b3ff00;font-size:11px;" if platform.processor() == 'arm'
+            "color:#b3ff00;font-size:11px;" if _IS_APPLE_SILICON
             else "color:#888;font-size:11px;"
         )
         hdr.addWidget(hw)
@@ -359,11 +687,7 @@ class MainWindow(QMainWindow):
         self._remove_vid_btn.setFixedWidth(30)
         self._remove_vid_btn.setEnabled(False)
         self._remove_vid_btn.setToolTip("Remove video")
-        self._remove_vid_btn.setStyleSheet(
-            "QPushButton{color:#ff5555;border-color:#5a2222;background:#2a1818;}"
-            "QPushButton:hover{background:#3a2020;}"
-            "QPushButton:disabled{color:#444;border-color:#252525;background:#1b1b22;}"
-        )
+        self._remove_vid_btn.setObjectName("RemoveBtn")
         self._remove_vid_btn.clicked.connect(self._remove_video)
         vid_row.addWidget(self._video_slot_label, 1)
         vid_row.addWidget(add_vid_btn)
@@ -381,11 +705,7 @@ class MainWindow(QMainWindow):
         self._remove_sub_btn.setFixedWidth(30)
         self._remove_sub_btn.setEnabled(False)
         self._remove_sub_btn.setToolTip("Remove subtitle")
-        self._remove_sub_btn.setStyleSheet(
-            "QPushButton{color:#ff5555;border-color:#5a2222;background:#2a1818;}"
-            "QPushButton:hover{background:#3a2020;}"
-            "QPushButton:disabled{color:#444;border-color:#252525;background:#1b1b22;}"
-        )
+        self._remove_sub_btn.setObjectName("RemoveBtn")
         self._remove_sub_btn.clicked.connect(self._remove_subtitle)
         sub_row.addWidget(self._sub_slot_label, 1)
         sub_row.addWidget(add_sub_btn)
@@ -407,8 +727,12 @@ class MainWindow(QMainWindow):
         # Subtitle cue list
         cue_grp = QGroupBox("Subtitle Cues")
         cue_v = QVBoxLayout(cue_grp)
-        self.cue_list = QListWidget()
-        self.cue_list.itemClicked.connect(self._jump_to_cue)
+        self.cue_model = CueListModel(self)
+        self.cue_list = QListView()
+        self.cue_list.setModel(self.cue_model)
+        self.cue_list.setUniformItemSizes(True)   # O(1) layout per row
+        self.cue_list.setEditTriggers(QListView.NoEditTriggers)
+        self.cue_list.clicked.connect(self._jump_to_cue)
         cue_v.addWidget(self.cue_list)
 
         left_v.addWidget(files_grp)
@@ -445,6 +769,13 @@ class MainWindow(QMainWindow):
         self.timeline_slider.setMinimum(0)
         self.timeline_slider.setMaximum(1000)
         self.timeline_slider.valueChanged.connect(self._on_slider_moved)
+        # Drop to fast scaling while scrubbing; smooth again on release
+        self.timeline_slider.sliderPressed.connect(
+            lambda: self.preview.set_interactive(True)
+        )
+        self.timeline_slider.sliderReleased.connect(
+            lambda: self.preview.set_interactive(False)
+        )
         self.timeline_slider.setEnabled(False)
 
         time_row = QHBoxLayout()
@@ -459,11 +790,64 @@ class MainWindow(QMainWindow):
         center_v.addLayout(time_row)
 
         # ── RIGHT PANEL ──────────────────────────────────────────────────
+        # Built lazily on first media load: the style/render panels carry
+        # the font combo (hundreds of QFontDatabase families) and a couple
+        # dozen widgets a video-only preview session never touches.
         right_w = QWidget()
-        right_v = QVBoxLayout(right_w)
-        right_v.setContentsMargins(0, 0, 0, 0)
-        right_v.setSpacing(8)
+        self._right_v = QVBoxLayout(right_w)
+        self._right_v.setContentsMargins(0, 0, 0, 0)
+        self._right_v.setSpacing(8)
+        self._right_panel_hint = QLabel("Load a video or subtitle\nto edit style settings")
+        self._right_panel_hint.setAlignment(Qt.AlignCenter)
+        self._right_panel_hint.setStyleSheet("color:#444;font-size:11px;")
+        self._right_v.addWidget(self._right_panel_hint)
+        self._right_v.addStretch()
+        self._right_panel_built = False
 
+        # ── Assemble splitter ─────────────────────────────────────────
+        splitter.addWidget(left_w)
+        splitter.addWidget(center_w)
+        splitter.addWidget(right_w)
+        splitter.setSizes([240, 660, 300])
+        rl.addWidget(splitter, 1)
+
+        # ── Footer ───────────────────────────────────────────────────────
+        sep = QFrame(); sep.setFrameShape(QFrame.HLine)
+        rl.addWidget(sep)
+
+        footer = QHBoxLayout()
+        footer.setSpacing(8)
+
+        self.status_label = QLabel("Ready")
+        self.status_label.setStyleSheet("color:#666;font-size:11px;")
+
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setValue(0)
+
+        self.cancel_btn = QPushButton("Cancel")
+        self.cancel_btn.setObjectName("CancelBtn")
+        self.cancel_btn.setEnabled(False)
+        self.cancel_btn.clicked.connect(self._cancel_render)
+
+        self.start_btn = QPushButton("▶  Start Rendering")
+        self.start_btn.setEnabled(False)
+        self.start_btn.setMinimumHeight(36)
+        self.start_btn.setObjectName("StartBtn")
+        self.start_btn.clicked.connect(self._start_render)
+
+        footer.addWidget(self.status_label)
+        footer.addWidget(self.progress_bar, 1)
+        footer.addWidget(self.cancel_btn)
+        footer.addWidget(self.start_btn)
+        rl.addLayout(footer)
+
+    def _ensure_right_panel(self):
+        if not self._right_panel_built:
+            self._right_panel_built = True
+            self._right_panel_hint.hide()
+            self._build_right_panel()
+
+    def _build_right_panel(self):
         # ─ Subtitle Style ─
         style_grp = QGroupBox("Subtitle Style")
         form = QFormLayout(style_grp)
@@ -472,21 +856,24 @@ class MainWindow(QMainWindow):
         form.setVerticalSpacing(7)
 
         self.font_combo = QComboBox()
-        for fam in QFontDatabase().families():
-            self.font_combo.addItem(fam)
+        # Single batch insert (one model reset) with signals suppressed
+        # while the hundreds of families load.
+        self.font_combo.blockSignals(True)
+        self.font_combo.addItems(_font_families())
         self.font_combo.setCurrentText("Arial")
-        self.font_combo.currentTextChanged.connect(self._trigger_preview)
+        self.font_combo.blockSignals(False)
+        self.font_combo.currentTextChanged.connect(self._on_style_changed)
 
         self.size_spin = QSpinBox()
         self.size_spin.setRange(10, 200)
         self.size_spin.setValue(48)
-        self.size_spin.valueChanged.connect(self._trigger_preview)
+        self.size_spin.valueChanged.connect(self._on_style_changed)
 
         font_style_row = QHBoxLayout()
         self.bold_chk = QCheckBox("Bold")
         self.italic_chk = QCheckBox("Italic")
-        self.bold_chk.toggled.connect(self._trigger_preview)
-        self.italic_chk.toggled.connect(self._trigger_preview)
+        self.bold_chk.toggled.connect(self._on_style_changed)
+        self.italic_chk.toggled.connect(self._on_style_changed)
         font_style_row.addWidget(self.bold_chk)
         font_style_row.addWidget(self.italic_chk)
         font_style_row.addStretch()
@@ -503,7 +890,7 @@ class MainWindow(QMainWindow):
         self.outline_size_spin.setRange(0, 10)
         self.outline_size_spin.setValue(0)          # no outline by default
         self.outline_size_spin.setToolTip("Stroke width (0 = no outline)")
-        self.outline_size_spin.valueChanged.connect(self._trigger_preview)
+        self.outline_size_spin.valueChanged.connect(self._on_style_changed)
         outline_row.addWidget(self.outline_btn)
         outline_row.addWidget(self.outline_size_spin)
         outline_row.addWidget(QLabel("px"))
@@ -514,29 +901,27 @@ class MainWindow(QMainWindow):
         self.outline_opacity_slider = QSlider(Qt.Horizontal)
         self.outline_opacity_slider.setRange(0, 100)
         self.outline_opacity_slider.setValue(100)   # 100% = fully opaque
-        self.outline_opacity_slider.valueChanged.connect(self._trigger_preview)
         self._outline_opacity_lbl = QLabel("100%")
         self._outline_opacity_lbl.setFixedWidth(34)
-        self.outline_opacity_slider.valueChanged.connect(
-            lambda v: self._outline_opacity_lbl.setText(f"{v}%")
-        )
+        # One typed slot updates the label and debounces the preview —
+        # a single dispatch per change instead of two lambda trampolines.
+        self.outline_opacity_slider.valueChanged.connect(self._on_opacity_changed)
         opacity_row.addWidget(self.outline_opacity_slider)
         opacity_row.addWidget(self._outline_opacity_lbl)
 
         self.shadow_spin = QSpinBox()
         self.shadow_spin.setRange(0, 20)
         self.shadow_spin.setValue(2)
-        self.shadow_spin.valueChanged.connect(self._trigger_preview)
+        self.shadow_spin.valueChanged.connect(self._on_style_changed)
 
         pos_row = QHBoxLayout()
         pos_row.setSpacing(6)
         self.pos_slider = QSlider(Qt.Horizontal)
         self.pos_slider.setRange(0, 100)
         self.pos_slider.setValue(10)
-        self.pos_slider.valueChanged.connect(self._trigger_preview)
         self._pos_lbl = QLabel("10")
         self._pos_lbl.setFixedWidth(24)
-        self.pos_slider.valueChanged.connect(lambda v: self._pos_lbl.setText(str(v)))
+        self.pos_slider.valueChanged.connect(self._on_pos_changed)
         pos_row.addWidget(self.pos_slider)
         pos_row.addWidget(self._pos_lbl)
 
@@ -568,9 +953,15 @@ class MainWindow(QMainWindow):
         bg_row.addWidget(self._bg_swatch)
 
         self.codec_combo = QComboBox()
-        self.codec_combo.addItems([
-            "h264_videotoolbox", "hevc_videotoolbox", "libx264", "libx265",
-        ])
+        # Offer only encoders the local FFmpeg actually has (reuses the
+        # memoized -encoders probe) instead of a hardcoded macOS-flavoured
+        # list; "auto" still resolves to the best of these at render time.
+        codecs = ["auto"]
+        hw = FFmpegBuilder._detect_hw_encoder()
+        if hw:
+            codecs += [hw, hw.replace("h264", "hevc")]
+        codecs += ["libx264", "libx265"]
+        self.codec_combo.addItems(codecs)
 
         self.quality_combo = QComboBox()
         self.quality_combo.addItems(["Low", "Medium", "Best"])
@@ -584,51 +975,9 @@ class MainWindow(QMainWindow):
         rform.addRow("Quality:", self.quality_combo)
         rform.addRow("Format:", self.format_combo)
 
-        right_v.addWidget(style_grp)
-        right_v.addWidget(render_grp)
-        right_v.addStretch()
-
-        # ── Assemble splitter ─────────────────────────────────────────
-        splitter.addWidget(left_w)
-        splitter.addWidget(center_w)
-        splitter.addWidget(right_w)
-        splitter.setSizes([240, 660, 300])
-        rl.addWidget(splitter, 1)
-
-        # ── Footer ───────────────────────────────────────────────────────
-        sep = QFrame(); sep.setFrameShape(QFrame.HLine)
-        rl.addWidget(sep)
-
-        footer = QHBoxLayout()
-        footer.setSpacing(8)
-
-        self.status_label = QLabel("Ready")
-        self.status_label.setStyleSheet("color:#666;font-size:11px;")
-
-        self.progress_bar = QProgressBar()
-        self.progress_bar.setValue(0)
-
-        self.cancel_btn = self._action_btn("Cancel", "#ffb300", "#3a2c00", "#6b5200")
-        self.cancel_btn.setEnabled(False)
-        self.cancel_btn.clicked.connect(self._cancel_render)
-
-        self.start_btn = QPushButton("▶  Start Rendering")
-        self.start_btn.setEnabled(False)
-        self.start_btn.setMinimumHeight(36)
-        self.start_btn.setStyleSheet(
-            "QPushButton{"
-            "background:qlineargradient(x1:0,y1:0,x2:1,y2:0,stop:0 #7acc00,stop:1 #b3ff00);"
-            "color:#000;font-weight:700;font-size:13px;border:none;border-radius:8px;}"
-            "QPushButton:hover{background:#ccff33;}"
-            "QPushButton:disabled{background:#23232d;color:#484858;border:1px solid #2b2b38;}"
-        )
-        self.start_btn.clicked.connect(self._start_render)
-
-        footer.addWidget(self.status_label)
-        footer.addWidget(self.progress_bar, 1)
-        footer.addWidget(self.cancel_btn)
-        footer.addWidget(self.start_btn)
-        rl.addLayout(footer)
+        # Insert above the trailing stretch added in _build_ui
+        self._right_v.insertWidget(0, style_grp)
+        self._right_v.insertWidget(1, render_grp)
 
     # ═══════════════════════════════════════════════════════════════════
     # Widget factories
@@ -643,20 +992,7 @@ class MainWindow(QMainWindow):
         return btn
 
     def _apply_swatch_style(self, btn: QPushButton, color: str):
-        btn.setStyleSheet(
-            f"background:{color};border:1px solid #3a3a50;border-radius:5px;"
-        )
-
-    def _action_btn(self, text: str, fg: str, bg: str, border: str) -> QPushButton:
-        btn = QPushButton(text)
-        btn.setStyleSheet(
-            f"QPushButton{{background:{bg};border:1px solid {border};color:{fg};"
-            f"border-radius:7px;padding:6px 14px;}}"
-            f"QPushButton:hover{{background:{border};}}"
-            f"QPushButton:disabled{{background:#1b1b22;color:#484858;"
-            f"border-color:#252530;}}"
-        )
-        return btn
+        btn.setStyleSheet(_SWATCH_QSS.format(color))
 
     # ═══════════════════════════════════════════════════════════════════
     # File management
@@ -687,6 +1023,7 @@ class MainWindow(QMainWindow):
                 self._set_subtitle(f)
 
     def _set_video(self, path: str):
+        self._ensure_right_panel()
         self.video_path = path
         name = os.path.basename(path)
         self._video_slot_label.setText(name)
@@ -701,6 +1038,7 @@ class MainWindow(QMainWindow):
         self._trigger_preview()
 
     def _set_subtitle(self, path: str):
+        self._ensure_right_panel()
         self.subtitle_path = path
         name = os.path.basename(path)
         self._sub_slot_label.setText(name)
@@ -719,6 +1057,7 @@ class MainWindow(QMainWindow):
         self.timeline_slider.setEnabled(False)
         self.start_btn.setEnabled(False)
         self.time_label.setText("00:00:00 / 00:00:00")
+        self._displayed_key = None
         self.preview.clear()
 
     def _remove_subtitle(self):
@@ -726,25 +1065,20 @@ class MainWindow(QMainWindow):
         self._sub_slot_label.setText("No subtitle")
         self._sub_slot_label.setStyleSheet("color:#666;font-size:11px;")
         self._remove_sub_btn.setEnabled(False)
-        self.cue_list.clear()
+        self.cue_model.set_cues([])
         self._trigger_preview()
 
     def _load_cue_list(self, path: str):
-        from core.subtitle_manager import SubtitleManager
-        cues = SubtitleManager().parse_srt_cues(path)
-        self.cue_list.clear()
-        for cue in cues:
-            s = cue['start_ms'] / 1000
-            tc = f"{int(s//3600):02d}:{int((s%3600)//60):02d}:{int(s%60):02d}"
-            text = cue['text'].replace('\n', ' ')
-            if len(text) > 58:
-                text = text[:55] + '…'
-            item = QListWidgetItem(f"[{tc}]  {text}")
-            item.setData(Qt.UserRole, cue['start_ms'] / 1000.0)
-            self.cue_list.addItem(item)
-
-    def _jump_to_cue(self, item: QListWidgetItem):
-        t = item.data(Qt.UserRole)
+        # Parse + format off-thread; _on_cues_loaded fills the list
+        QThreadPool.globalInstance().start(
+            _CueParseTask(path, self.cues_loaded_signal)
+        )
+
+    def _on_cues_loaded(self, cues: list):
+        self.cue_model.set_cues(cues)
+
+    def _jump_to_cue(self, index: QModelIndex):
+        t = index.data(Qt.UserRole)
         if self.duration > 0:
             self.timeline_slider.setValue(int(t / self.duration * 1000))
 
@@ -752,35 +1086,47 @@ class MainWindow(QMainWindow):
     # Color pickers
     # ═══════════════════════════════════════════════════════════════════
 
+    @property
+    def sub_color(self) -> str:
+        return self._sub_qcolor.name()
+
+    @property
+    def outline_color(self) -> str:
+        return self._outline_qcolor.name()
+
+    @property
+    def bg_color_hex(self) -> str:
+        return self._bg_qcolor.name()[1:]
+
     def _pick_text_color(self):
-        c = QColorDialog.getColor(QColor(self.sub_color), self, "Text Color")
+        c = QColorDialog.getColor(self._sub_qcolor, self, "Text Color")
         if c.isValid():
-            self.sub_color = c.name()
-            self._apply_swatch_style(self.color_btn, self.sub_color)
-            self._trigger_preview()
+            self._sub_qcolor = c
+            self._apply_swatch_style(self.color_btn, c.name())
+            self._on_style_changed()
 
     def _pick_outline_color(self):
-        c = QColorDialog.getColor(QColor(self.outline_color), self, "Outline Color")
+        c = QColorDialog.getColor(self._outline_qcolor, self, "Outline Color")
         if c.isValid():
-            self.outline_color = c.name()
-            self._apply_swatch_style(self.outline_btn, self.outline_color)
-            self._trigger_preview()
+            self._outline_qcolor = c
+            self._apply_swatch_style(self.outline_btn, c.name())
+            self._on_style_changed()
 
     def _on_bg_changed(self, _idx: int):
-        presets = {"Green (#00FF00)": "00FF00", "Blue (#0000FF)": "0000FF"}
+        presets = {"Green (#00FF00)": "#00FF00", "Blue (#0000FF)": "#0000FF"}
         text = self.bg_combo.currentText()
         if text in presets:
-            self.bg_color_hex = presets[text]
+            self._bg_qcolor = QColor(presets[text])
         elif text == "Custom…":
-            c = QColorDialog.getColor(QColor(f"#{self.bg_color_hex}"), self, "Background Color")
+            c = QColorDialog.getColor(self._bg_qcolor, self, "Background Color")
             if c.isValid():
-                self.bg_color_hex = c.name().lstrip('#')
+                self._bg_qcolor = c
             else:
                 self.bg_combo.blockSignals(True)
                 self.bg_combo.setCurrentIndex(0)
                 self.bg_combo.blockSignals(False)
-                self.bg_color_hex = "00FF00"
-        self._apply_swatch_style(self._bg_swatch, f"#{self.bg_color_hex}")
+                self._bg_qcolor = QColor("#00FF00")
+        self._apply_swatch_style(self._bg_swatch, self._bg_qcolor.name())
         self._trigger_preview()
 
     # ═══════════════════════════════════════════════════════════════════
@@ -793,12 +1139,11 @@ class MainWindow(QMainWindow):
     def _on_aspect_changed(self, _idx: int):
         ar = "9:16" if "9:16" in self.aspect_combo.currentText() else "16:9"
         self.preview.set_aspect_ratio(ar)
+        self._resolution = "1080x1920" if ar == "9:16" else "1920x1080"
         self._trigger_preview()
 
     def _current_resolution(self) -> str:
-        if "9:16" in self.aspect_combo.currentText():
-            return "1080x1920"
-        return "1920x1080"
+        return self._resolution
 
     # ═══════════════════════════════════════════════════════════════════
     # Timeline
@@ -806,7 +1151,7 @@ class MainWindow(QMainWindow):
 
     def _on_slider_moved(self, value: int):
         self._update_time_label(value)
-        self._preview_timer.start(220)
+        self._trigger_preview()
 
     def _update_time_label(self, v: int):
         cur = (v / 1000.0) * self.duration
@@ -816,33 +1161,143 @@ class MainWindow(QMainWindow):
 
     @staticmethod
     def _t(sec: float) -> str:
-        sec = max(0.0, sec)
-        return f"{int(sec//3600):02d}:{int((sec%3600)//60):02d}:{int(sec%60):02d}"
+        # C-level strftime: this runs at slider rate for the time label.
+        return time.strftime('%H:%M:%S', time.gmtime(max(0.0, sec)))
+
+    @Slot(int)
+    def _on_opacity_changed(self, v: int):
+        self._outline_opacity_lbl.setText(f"{v}%")
+        self._style_cache = None
+        self._trigger_preview()
+
+    @Slot(int)
+    def _on_pos_changed(self, v: int):
+        self._pos_lbl.setText(str(v))
+        self._style_cache = None
+        self._trigger_preview()
+
+    @Slot()
+    def _on_style_changed(self):
+        # Shared slot for every control that feeds _build_style_string:
+        # drops the memoized string, then debounces a preview like any
+        # other change.
+        self._style_cache = None
+        self._trigger_preview()
 
     def _trigger_preview(self):
-        self._preview_timer.start(250)
+        if self.isMinimized():
+            return
+        # Restarting the single-shot timer coalesces slider/spinbox bursts
+        # so only the last value in a drag reaches the render pipeline.
+        self._preview_timer.start(_PREVIEW_DEBOUNCE_MS)
 
     def _do_update_preview(self):
         if not self.video_path:
             return
-        self.preview.set_loading(True)
-        time_sec = (self.timeline_slider.value() / 1000.0) * self.duration
-        tmp = os.path.join(
-            os.path.dirname(os.path.abspath(__file__)), '..', 'preview.jpg'
+        # Snap the requested position to the 25 fps lavfi grid up front:
+        # batch prefetches cache under quantized times, so lookups must
+        # land on the same grid for the warmed neighbours to ever hit.
+        fps = FFmpegBuilder.PREVIEW_FPS
+        time_sec = round(
+            (self.timeline_slider.value() / 1000.0) * self.duration * fps
+        ) / fps
+        styles = self._build_style_string()
+        res = self._current_resolution()
+        # Render at what the widget can actually show (in device pixels),
+        # not the full output resolution — a 640×360 frame instead of
+        # full HD is ~9× fewer pixels through libass, mjpeg and the pipe.
+        dpr = self.preview.devicePixelRatioF()
+        psz = self.preview.size()
+        preview_size = (
+            f"{max(2, int(psz.width() * dpr))}x{max(2, int(psz.height() * dpr))}"
         )
-        styles   = self._build_style_string()
-        res      = self._current_resolution()
-        success  = MediaEngine.extract_preview_frame(
-            self.video_path, self.subtitle_path,
-            time_sec, tmp, styles, self.bg_color_hex, res,
+        key = (self.video_path, self.subtitle_path, round(time_sec, 2),
+               styles, res, self.bg_color_hex, preview_size)
+
+        if key == self._displayed_key:
+            # Signal noise (unrelated widget, slider settling on the same
+            # value): the requested frame is already on screen. Like the
+            # cache-hit branch, invalidate any in-flight render and stop
+            # the spinner so neither can clobber the correct frame.
+            self._preview_gen += 1
+            self._loading_timer.stop()
+            return
+
+        cached = self._preview_cache.get(key)
+        if cached is not None:
+            # LRU hit: re-show the decoded frame, no subprocess spawned.
+            self._preview_cache.move_to_end(key)
+            self._preview_gen += 1      # drop any in-flight stale render
+            self._loading_timer.stop()
+            self._displayed_key = key
+            self.preview.set_image(cached)
+            return
+
+        # Don't flash the spinner for renders that finish almost at once;
+        # it only appears if no frame has landed within the grace period.
+        self._loading_timer.start()
+        self._preview_gen += 1
+        gen = self._preview_gen
+        self._preview_key = key
+        if self._preview_runner is not None:
+            # Don't let an obsolete frame render keep burning CPU until it
+            # finishes — its result would be dropped by the gen check anyway.
+            self._preview_runner.cancel()
+        args = (
+            self.video_path, self.subtitle_path, time_sec,
+            styles, self.bg_color_hex, res, preview_size,
         )
-        if success and os.path.exists(tmp):
-            pix = QPixmap(tmp)
-            self.preview.set_pixmap(pix)
-            try:
-                os.remove(tmp)
-            except Exception:
-                pass
+        times = None
+        if self.timeline_slider.isSliderDown() and self.duration > 0:
+            # Mid-drag the user is likely to probe nearby positions next;
+            # render ±2 s in the same invocation to warm the cache.
+            times = [min(self.duration, max(0.0, time_sec + dt))
+                     for dt in (-2.0, -1.0, 0.0, 1.0, 2.0)]
+        task = _PreviewTask(gen, args, self.preview_ready_signal, times=times)
+        self._preview_runner = task.runner
+        QThreadPool.globalInstance().start(task)
+
+    @Slot()
+    def _show_loading(self):
+        self.preview.set_loading(True)
+
+    def _cache_frame(self, key: tuple, image):
+        self._preview_cache[key] = image
+        self._preview_cache.move_to_end(key)
+        while len(self._preview_cache) > _PREVIEW_CACHE_MAX:
+            self._preview_cache.popitem(last=False)
+
+    def _on_preview_ready(self, gen: int, result):
+        if gen != self._preview_gen:
+            return                      # a newer request superseded this frame
+        self._loading_timer.stop()
+
+        if isinstance(result, list):
+            # Batch prefetch: cache every frame under its quantized time,
+            # show the one closest to the requested position.
+            base = self._preview_key
+            req_t = base[2]
+            best = None
+            for t, img in result:
+                if img.isNull():
+                    continue
+                self._cache_frame(base[:2] + (round(t, 2),) + base[3:], img)
+                if best is None or abs(t - req_t) < abs(best[0] - req_t):
+                    best = (t, img)
+            if best is not None:
+                self._cache_frame(base, best[1])
+                self._displayed_key = base
+                self.preview.set_image(best[1])
+            else:
+                self.preview.set_loading(False)
+            return
+
+        image = result
+        if image is not None and not image.isNull():
+            if self._preview_key is not None:
+                self._cache_frame(self._preview_key, image)
+                self._displayed_key = self._preview_key
+            self.preview.set_image(image)
         else:
             self.preview.set_loading(False)
 
@@ -851,28 +1306,42 @@ class MainWindow(QMainWindow):
     # ═══════════════════════════════════════════════════════════════════
 
     def _build_style_string(self) -> str:
+        # Memoized: ten widget getters (each a Qt round-trip) run only
+        # after a style control changed, not on every timeline scrub tick.
+        if self._style_cache is not None:
+            return self._style_cache
         # Opacity: slider 0–100 → ASS 0–255 (inverted: 100% opaque = 0)
-        opacity_pct    = self.outline_opacity_slider.value()   # 100 = fully opaque
-        outline_alpha  = int((100 - opacity_pct) / 100 * 255)  # 0 = opaque in ASS
+        outline_alpha  = _OPACITY_LUT[self.outline_opacity_slider.value()]
         margin_v       = self.pos_slider.value()               # 0-100 (mapped ×2 in builder)
-        return (
-            f"FontName={self.font_combo.currentText()},"
-            f"FontSize={self.size_spin.value()},"
-            f"Bold={'-1' if self.bold_chk.isChecked() else '0'},"
-            f"Italic={'-1' if self.italic_chk.isChecked() else '0'},"
-            f"PrimaryColour={self.sub_color},"
-            f"OutlineColour={self.outline_color},"
-            f"OutlineAlpha={outline_alpha},"
-            f"Outline={self.outline_size_spin.value()},"
-            f"Shadow={self.shadow_spin.value()},"
-            f"MarginV={margin_v}"
-        )
+        self._style_cache = _STYLE_TEMPLATE.format_map({
+            'FontName':      self.font_combo.currentText(),
+            'FontSize':      self.size_spin.value(),
+            'Bold':          '-1' if self.bold_chk.isChecked() else '0',
+            'Italic':        '-1' if self.italic_chk.isChecked() else '0',
+            'PrimaryColour': self.sub_color,
+            'OutlineColour': self.outline_color,
+            'OutlineAlpha':  outline_alpha,
+            'Outline':       self.outline_size_spin.value(),
+            'Shadow':        self.shadow_spin.value(),
+            'MarginV':       margin_v,
+        })
+        return self._style_cache
 
     # ═══════════════════════════════════════════════════════════════════
     # Render
     # ═══════════════════════════════════════════════════════════════════
 
     def _on_progress(self, val: float, msg: str = ""):
+        # Hot path first: ordinary ticks arrive continuously during a
+        # render, and ticks that round to the already-shown percentage
+        # are dropped before touching any widget.
+        v = int(val)
+        if 0 <= v <= 100:
+            if v != self._last_pct:
+                self._last_pct = v
+                self.progress_bar.setValue(v)
+                self.status_label.setText(f"Rendering… {v}%")
+            return
         if val == -1:
             QMessageBox.critical(
                 self, "Render Error",
@@ -888,9 +1357,6 @@ class MainWindow(QMainWindow):
             QMessageBox.information(self, "Done", "Rendering completed successfully!")
             self.start_btn.setEnabled(True)
             self.cancel_btn.setEnabled(False)
-        else:
-            self.progress_bar.setValue(int(val))
-            self.status_label.setText(f"Rendering… {int(val)}%")
 
     def _start_render(self):
         if not self.video_path:
@@ -904,13 +1370,23 @@ class MainWindow(QMainWindow):
             return
         if not out.endswith(ext):
             out += ext
+        # Reject an unwritable destination before flipping any UI state,
+        # so a doomed render never leaves Start disabled.
+        out_dir = os.path.dirname(out) or "."
+        if not os.access(out_dir, os.W_OK):
+            QMessageBox.warning(
+                self, "Invalid Output",
+                f"Cannot write to the selected folder:\n{out_dir}"
+            )
+            return
 
         self.start_btn.setEnabled(False)
         self.cancel_btn.setEnabled(True)
         self.progress_bar.setValue(0)
+        self._last_pct = -1
         self.status_label.setText("Queued…")
 
-        MediaEngine.render_green_sub(
+        QThreadPool.globalInstance().start(_RenderJob(dict(
             video_path=self.video_path,
             subtitle_path=self.subtitle_path,
             output_path=out,
@@ -920,9 +1396,11 @@ class MainWindow(QMainWindow):
             codec=self.codec_combo.currentText(),
             quality=self.quality_combo.currentText(),
             resolution=self._current_resolution(),
-        )
+        )))
 
     def _cancel_render(self):
+        # The queue singleton exists independently of the enqueue job, so
+        # cancellation works even while setup is still running off-thread.
         MediaEngine.get_queue().cancel_current_job()
         self.status_label.setText("Cancelling…")
         self.cancel_btn.setEnabled(False)